@@ -285,7 +285,7 @@ async def test_bottleneck_analysis(test_history_id: int) -> Dict[str, Any]:
     """
     try:
         from app.services.analysis.performance_bottleneck_detector import get_performance_bottleneck_detector
-        from app.services.monitoring.influxdb_service import InfluxDBService
+        from app.dependencies import get_influxdb_service
         from app.services.testing.test_history_service import get_test_history_by_id
         from app.models.sqlite.database import SessionLocal
 
@@ -307,7 +307,7 @@ async def test_bottleneck_analysis(test_history_id: int) -> Dict[str, Any]:
             db.close()
 
         # 2. InfluxDB에서 실제 시계열 데이터 조회
-        influxdb_service = InfluxDBService()
+        influxdb_service = get_influxdb_service()
         timeseries_data = influxdb_service.get_test_timeseries_data(job_name)
 
         if not timeseries_data:
@@ -1,9 +1,18 @@
 from typing import Any
 
-from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from app.common.response.code import BaseCode
 
+
+def _json_response(response_body: dict, status_code: int) -> ORJSONResponse:
+    # dict/list/datetime/dataclass 등 orjson이 직접 직렬화할 수 있는 값은 jsonable_encoder를 거치지 않고,
+    # Pydantic 모델 등 orjson이 처리하지 못하는 값이 섞여 있을 때만 변환 후 직렬화
+    try:
+        return ORJSONResponse(content=response_body, status_code=status_code)
+    except TypeError:
+        return ORJSONResponse(content=jsonable_encoder(response_body), status_code=status_code)
+
 class ResponseTemplate:
     def __init__(self, success: bool, message: str, status_code: int, data: Any = None):
         self.success = success
@@ -21,7 +30,7 @@ class ResponseTemplate:
             "data": data,
             "status_code": status_code,
         }
-        return JSONResponse(content=jsonable_encoder(response_body), status_code=200)
+        return _json_response(response_body, 200)
 
     @classmethod
     def fail(cls, code: BaseCode, custom_message: str = None, data: Any = None):
@@ -35,4 +44,4 @@ class ResponseTemplate:
             "data": data,
             "status_code": status_code,
         }
-        return JSONResponse(content=jsonable_encoder(response_body), status_code=status_code)
\ No newline at end of file
+        return _json_response(response_body, status_code)
@@ -1,7 +1,8 @@
 from .repositories import (get_scenario_history_repository,
                            get_test_resource_timeseries_repository,
                            get_test_history_repository)
-from .services import get_resource_service, get_resource_response_builder
+from .services import (get_resource_service, get_pod_service, get_service_service,
+                       get_deploy_service, get_influxdb_service, get_resource_response_builder)
 
 # Singleton Instance 관리 패키지
 __all__ = [
@@ -9,5 +10,9 @@ __all__ = [
     "get_test_resource_timeseries_repository",
     "get_test_history_repository",
     "get_resource_service",
+    "get_pod_service",
+    "get_service_service",
+    "get_deploy_service",
+    "get_influxdb_service",
     "get_resource_response_builder",
 ]
\ No newline at end of file
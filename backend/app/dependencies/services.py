@@ -1,21 +1,48 @@
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from app.common.exception.api_exception import ApiException
 from app.common.response.code import BaseCode, FailureCode
 from app.services.testing.resource_response_builder import TestHistoryResourcesResponseBuilder
 from app.services.testing.resource_summary_response_builder import SummaryResourcesResponseBuilder
 from app.services.testing.resource_timeseries_response_builder import TimeseriesResourcesResponseBuilder
+from k8s.deploy_service import DeployService
+from k8s.pod_service import PodService
 from k8s.resource_service import ResourceService
+from k8s.service_service import ServiceService
 from app.dependencies.repositories import (
     get_test_history_repository,
     get_scenario_history_repository,
     get_test_resource_timeseries_repository
 )
 
+if TYPE_CHECKING:
+    from app.services.monitoring.influxdb_service import InfluxDBService
+
 @lru_cache()
 def get_resource_service() -> ResourceService:
     return ResourceService()
 
+@lru_cache()
+def get_pod_service() -> PodService:
+    return PodService()
+
+@lru_cache()
+def get_service_service() -> ServiceService:
+    return ServiceService()
+
+@lru_cache()
+def get_deploy_service() -> DeployService:
+    """kube config 로드와 API client 생성을 프로세스당 한 번만 수행"""
+    return DeployService()
+
+@lru_cache()
+def get_influxdb_service() -> "InfluxDBService":
+    """InfluxDBClient(requests.Session 연결 풀)를 요청 간에 재사용"""
+    # influxdb_service → app.sse → test_history_service → app.dependencies 순환 import 방지
+    from app.services.monitoring.influxdb_service import InfluxDBService
+    return InfluxDBService()
+
 @lru_cache()
 def get_resource_response_builder(type: str) -> TestHistoryResourcesResponseBuilder:
     """Spring Bean Container 스타일의 Dependency Injection Factory"""
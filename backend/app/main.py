@@ -33,6 +33,10 @@ async def lifespan(app: FastAPI):
     
     # 데이터베이스 테이블 초기화
     models.Base.metadata.create_all(bind=engine)
+    # create_all은 이미 존재하는 테이블에 새 인덱스를 추가하지 않으므로 누락된 인덱스만 별도 생성
+    for table in models.Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     
     # kubernetes connection test
     try:
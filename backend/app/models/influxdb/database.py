@@ -10,4 +10,5 @@ client = InfluxDBClient(
     None,
     None,
     os.getenv("INFLUXDB_DATABASE"),
+    gzip=True,
 )
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
@@ -20,9 +20,31 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Async engine (새로 추가)
 async_engine = create_async_engine(
-    ASYNC_DATABASE_URL, connect_args={"check_same_thread": False}
+    ASYNC_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    pool_size=20,           # 기본 연결 풀 크기 (sync engine과 동일)
+    max_overflow=30,        # 초과 연결 허용
+    pool_timeout=30,        # 연결 대기 시간
+    pool_recycle=3600       # 연결 재사용 시간
 )
 
+
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    """
+    연결마다 WAL 저널 모드와 synchronous=NORMAL 적용
+
+    WAL 모드에서는 읽기와 쓰기가 서로 막지 않고, NORMAL은 커밋마다 fsync 하지 않으므로
+    스케줄러/API가 동시에 쓰는 환경에서 쓰기 처리량이 크게 늘어납니다.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
+event.listen(engine, "connect", _set_sqlite_pragma)
+event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragma)
+
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
     class_=AsyncSession,
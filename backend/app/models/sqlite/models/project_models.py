@@ -1,6 +1,6 @@
 from typing import Dict, Optional, Any
 
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Table, DateTime, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Table, DateTime, Boolean, JSON, Index, text
 from sqlalchemy.orm import relationship
 from app.models.sqlite.database import Base
 
@@ -73,6 +73,20 @@ class ServerInfraModel(Base):
 
     tests_resources = relationship("TestResourceTimeseriesModel", back_populates="server_infra")
 
+    __table_args__ = (
+        # group_name 기준 OpenAPI 스펙 연결 조회/일괄 UPDATE용 복합 인덱스
+        Index("ix_server_infra_group_openapi", "group_name", "openapi_spec_id"),
+        # 리소스 이름(pod name) 기준 조회용 인덱스
+        Index("ix_server_infra_name", "name"),
+        # namespace + group_name 기준 그룹별 Pod 이름 조회용 복합 인덱스
+        Index("ix_server_infra_namespace_group", "namespace", "group_name"),
+        # OpenAPI 스펙과 연결되지 않은 서버 Pod 조회용 부분 인덱스
+        Index(
+            "ix_server_infra_unlinked_server", "namespace", "service_type",
+            sqlite_where=text("openapi_spec_id IS NULL"),
+        ),
+    )
+
 
 # 엔드포인트
 class EndpointModel(Base):
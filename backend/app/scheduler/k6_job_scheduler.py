@@ -1,7 +1,8 @@
 import asyncio
 import logging
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import List, Any, Dict
+from typing import List
 import threading
 from sqlalchemy.orm import Session
 
@@ -10,7 +11,7 @@ from app.models.sqlite.database import SessionLocal, AsyncSessionLocal
 from app.models.sqlite.models import TestHistoryModel, ScenarioHistoryModel
 from k8s.job_service import JobService
 from app.services.monitoring.metrics_aggregation_service import MetricsAggregationService
-from app.services.monitoring.influxdb_service import InfluxDBService
+from app.dependencies import get_influxdb_service
 from k8s.resource_service import ResourceService
 from app.services.testing.test_history_service import (
     get_test_history_by_job_name,
@@ -53,7 +54,7 @@ class K6JobScheduler:
         
         self.job_service = JobService(namespace=settings.KUBERNETES_PLOG_NAMESPACE)
         self.metrics_service = MetricsAggregationService()
-        self.influxdb_service = InfluxDBService()  # 새로운 InfluxDB 서비스
+        self.influxdb_service = get_influxdb_service()  # 새로운 InfluxDB 서비스
         self.resource_service = ResourceService(namespace=settings.KUBERNETES_TEST_NAMESPACE)
         self.is_running = False
         self._scheduler_thread = None
@@ -72,6 +73,7 @@ class K6JobScheduler:
             
         self.is_running = True
         self._stop_event.clear()
+        self.job_service.start_watch()
         self._scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self._scheduler_thread.start()
         logger.info(f"K6 Job Scheduler started with {self.poll_interval}s interval")
@@ -86,6 +88,8 @@ class K6JobScheduler:
         
         if self._scheduler_thread and self._scheduler_thread.is_alive():
             self._scheduler_thread.join(timeout=10)
+
+        self.job_service.stop_watch()
             
         logger.info("K6 Job Scheduler stopped")
 
@@ -121,23 +125,39 @@ class K6JobScheduler:
                 if not test_history:
                     logger.warning(f"No test history found for job: {job_name} - skipping processing")
                     continue
-                    
+
+                # 이미 메트릭이 SQLite에 저장된 테스트는 InfluxDB 재집계 없이 건너뜀
+                # (auto_delete_jobs=False면 완료된 Job이 남아 매 폴링마다 다시 조회됨)
+                # is_completed는 중지 API도 설정하므로 스케줄러만 기록하는 total_requests까지 확인
+                if test_history.is_completed and test_history.total_requests is not None:
+                    logger.debug(f"Metrics already persisted for job: {job_name} - skipping processing")
+                    continue
+
                 scenario_histories:List[ScenarioHistoryModel] = test_history.scenarios
 
+                # 진행 중에 TTL로 캐싱된 조회 결과는 버리고 완료 시점 기준으로 다시 집계
+                self.influxdb_service.invalidate_cached_metrics(
+                    job_name, *(scenario_history.scenario_tag for scenario_history in scenario_histories)
+                )
+
                 # 2. InfluxDB의 job_name과 매칭하여 테스트 전체 TPS, 응답시간, 에러율 계산
-                overall_metrics:Dict[str, Any] = self.influxdb_service.get_overall_metrics(job_name=test_history.job_name)
+                overall_metrics = self.influxdb_service.get_overall_metrics(job_name=test_history.job_name, completed=True)
 
                 # 3. 조회한 test_history에 업데이트 (null 체크 추가)
                 if overall_metrics:
-                    update_test_history_with_metrics(db, test_history, overall_metrics)
+                    update_test_history_with_metrics(db, test_history, asdict(overall_metrics))
                     logger.info(f"Updated overall metrics for job: {job_name}")
                 else:
                     logger.warning(f"No overall metrics found for job: {job_name} - skipping update")
 
                 # 4. scenario_history.scenario_tag를 통해 influxdb에서 시나리오별 메트릭 조회 및 업데이트
+                # (시나리오별 조회는 서로 독립적이므로 한 번에 병렬 조회)
+                scenario_metrics_by_tag = self.influxdb_service.get_scenario_metrics_bulk(
+                    [scenario_history.scenario_tag for scenario_history in scenario_histories], completed=True
+                )
                 for scenario_history in scenario_histories:
                     scenario_identifier = scenario_history.scenario_tag  # 테스트 시나리오 태그(쿼리할 때 사용하는 내부 식별자)
-                    scenario_metrics = self.influxdb_service.get_scenario_metrics(scenario_identifier)
+                    scenario_metrics = scenario_metrics_by_tag.get(scenario_identifier)
                     if scenario_metrics:
                         update_scenario_history_with_metrics(db, scenario_history, scenario_metrics)
                         logger.info(f"Updated scenario metrics for scenario: {scenario_identifier}")
@@ -145,7 +165,7 @@ class K6JobScheduler:
                         logger.warning(f"No scenario metrics found for scenario: {scenario_identifier} - skipping update")
 
                 # 5. 시계열 메트릭 데이터 수집 및 저장
-                timeseries_data = self.influxdb_service.get_test_timeseries_data(job_name)
+                timeseries_data = self.influxdb_service.get_test_timeseries_data(job_name, completed=True)
                 save_success = save_test_timeseries_metrics(db, scenario_histories, timeseries_data)
 
                 # 6. 서버 리소스 메트릭 수집 및 저장 (CPU, Memory)
@@ -195,7 +215,7 @@ class K6JobScheduler:
                 if not server_infras:
                     logger.warning(f"No server infra found for scenario: {scenario_history.id}")
 
-                time_range = self.influxdb_service.get_test_time_range(job_name)
+                time_range = self.influxdb_service.get_test_time_range(job_name, completed=True)
                 if not time_range:
                     logger.warning(f"No time range found for job: {job_name} - skipping resource metrics collection")
                     return
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import List
@@ -422,12 +423,14 @@ class AIAnalysisService:
 
         # k6 시계열 데이터 수집 및 전처리
         try:
-            from app.services.monitoring.influxdb_service import InfluxDBService
+            from app.dependencies import get_influxdb_service
 
             if test_history.job_name:
-                # InfluxDB에서 k6 시계열 데이터 조회
-                influxdb_service = InfluxDBService()
-                k6_timeseries_data = influxdb_service.get_test_timeseries_data(test_history.job_name)
+                # InfluxDB에서 k6 시계열 데이터 조회 (동기 HTTP 클라이언트이므로 이벤트 루프 밖에서 실행)
+                influxdb_service = get_influxdb_service()
+                k6_timeseries_data = await asyncio.to_thread(
+                    influxdb_service.get_test_timeseries_data, test_history.job_name
+                )
 
                 if k6_timeseries_data:
                     # 시계열 데이터 전처리
@@ -527,20 +530,20 @@ class AIAnalysisService:
         """
         try:
             # InfluxDB에서 시계열 데이터 가져오기
-            from app.services.monitoring.influxdb_service import InfluxDBService
+            from app.dependencies import get_influxdb_service
             from app.services.analysis.performance_bottleneck_detector import get_performance_bottleneck_detector
 
             # test_history_id로부터 job_name 추출 (여기서는 간단히 test_history_id를 사용)
             test_history_id = data.test_history_id
 
             # InfluxDB 서비스를 통해 시계열 데이터 조회
-            influxdb_service = InfluxDBService()
+            influxdb_service = get_influxdb_service()
 
             # job_name은 일반적으로 "test-{test_history_id}" 형식으로 생성됨
             job_name = f"test-{test_history_id}"
 
-            # k6 시계열 데이터 조회
-            timeseries_data = influxdb_service.get_test_timeseries_data(job_name)
+            # k6 시계열 데이터 조회 (동기 HTTP 클라이언트이므로 이벤트 루프 밖에서 실행)
+            timeseries_data = await asyncio.to_thread(influxdb_service.get_test_timeseries_data, job_name)
 
             if not timeseries_data:
                 logger.debug(f"No timeseries data found for job: {job_name}")
@@ -8,15 +8,72 @@ AI로부터 받은 JSON 형식의 통합 분석 응답을 파싱하여
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import re
 
 from app.schemas.analysis import (
     SingleAnalysisResponse, AnalysisType, AnalysisInsight
 )
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_JSON_FENCE_PREFIX = "```json"
+
+# insight 항목 기본값
+_DEFAULT_INSIGHT_CATEGORY = "performance"
+_DEFAULT_INSIGHT_MESSAGE = "인사이트 메시지가 없습니다."
+_DEFAULT_INSIGHT_SEVERITY = "info"
+
+# 응답마다 재사용하는 정규식은 모듈 로드 시 한 번만 컴파일
+_JSON_FENCE_PATTERN = re.compile(r"```json\s*\n(.*?)\n```", re.DOTALL)
+_TRAILING_COMMA_PATTERN = re.compile(r",\s*(\]|\})")
+_FENCE_STRIP_PATTERN = re.compile(r"^```json\s*|```$", re.IGNORECASE | re.MULTILINE)
+_LINE_COMMENT_PATTERN = re.compile(r"(?m)^\s*//.*$")
+_BLOCK_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """
+    첫 번째 '{'부터 중괄호 깊이를 추적하여 가장 바깥 JSON 객체 구간 추출
+
+    문자열 내부의 중괄호와 이스케이프 문자는 깊이 계산에서 제외합니다.
+    객체가 닫히지 않으면 마지막 '}'까지를 반환합니다.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for idx in range(start, len(text)):
+        ch = text[idx]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:idx + 1]
+
+    end = text.rfind("}")
+    return text[start:end + 1] if end > start else None
+
 
 class AnalysisParser:
     """AI 분석 응답 파싱 클래스"""
@@ -29,6 +86,7 @@ class AnalysisParser:
             "error_rate": AnalysisType.ERROR_RATE,
             "resource_usage": AnalysisType.RESOURCE_USAGE
         }
+        self._analysis_items: Tuple[Tuple[str, AnalysisType], ...] = tuple(self.analysis_type_mapping.items())
 
     def parse_response(
         self,
@@ -61,7 +119,7 @@ class AnalysisParser:
             # 각 분석 영역별로 SingleAnalysisResponse 생성
             responses = []
 
-            for key, analysis_type in self.analysis_type_mapping.items():
+            for key, analysis_type in self._analysis_items:
                 try:
                     if key in json_data:
                         response = self._parse_single_analysis(
@@ -100,30 +158,40 @@ class AnalysisParser:
                 end = response.rindex(end_tok)
                 raw = response[start:end].strip()
 
-            # 2) 기존 ```json ... ``` 코드블록
+            # 2) 응답이 코드펜스나 중괄호로 바로 시작하면 정규식 없이 추출
+            if raw is None:
+                stripped = response.lstrip()
+                if stripped.startswith(_JSON_FENCE_PREFIX):
+                    end = stripped.find("```", len(_JSON_FENCE_PREFIX))
+                    if end != -1:
+                        raw = stripped[len(_JSON_FENCE_PREFIX):end].strip()
+                elif stripped.startswith("{"):
+                    raw = _find_json_object(stripped)
+
+            # 3) 기존 ```json ... ``` 코드블록
             if raw is None:
-                json_block = re.search(r"```json\s*\n(.*?)\n```", response, re.DOTALL)
+                json_block = _JSON_FENCE_PATTERN.search(response)
                 if json_block:
                     raw = json_block.group(1).strip()
 
-            # 3) 중괄호로 감싼 가장 바깥 JSON 덩어리
+            # 4) 중괄호로 감싼 가장 바깥 JSON 덩어리
             if raw is None:
-                brace_match = re.search(r"\{.*\}", response, re.DOTALL)
-                if brace_match:
-                    raw = brace_match.group(0).strip()
+                brace_block = _find_json_object(response)
+                if brace_block:
+                    raw = brace_block.strip()
 
             if raw is None or not raw:
                 logger.error("No JSON pattern found in AI response")
                 return None
 
-            # 4) 정리 & 파싱 시도
+            # 5) 정리 & 파싱 시도
             cleaned = self._clean_json_str(raw)
             try:
-                return json.loads(cleaned)
-            except json.JSONDecodeError:
-                # 5) 후행 쉼표 제거 등 2차 정리 후 재시도
-                cleaned2 = re.sub(r",\s*(\]|\})", r"\1", cleaned)
-                return json.loads(cleaned2)
+                return _json_loads(cleaned)
+            except ValueError:
+                # 6) 후행 쉼표 제거 등 2차 정리 후 재시도
+                cleaned2 = _TRAILING_COMMA_PATTERN.sub(r"\1", cleaned)
+                return _json_loads(cleaned2)
 
         except Exception as e:
             logger.error(f"Error extracting JSON: {e}")
@@ -132,13 +200,13 @@ class AnalysisParser:
     def _clean_json_str(self, s: str) -> str:
         """경미한 JSON 오류 정정: 코드펜스/주석/BOM/제어문자 제거"""
         # 코드펜스 제거
-        s = re.sub(r"^```json\s*|```$", "", s.strip(), flags=re.IGNORECASE | re.MULTILINE)
+        s = _FENCE_STRIP_PATTERN.sub("", s.strip())
         # BOM 제거
         s = s.lstrip("\ufeff")
         # // 주석 제거
-        s = re.sub(r"(?m)^\s*//.*$", "", s)
+        s = _LINE_COMMENT_PATTERN.sub("", s)
         # /* */ 주석 제거
-        s = re.sub(r"/\*.*?\*/", "", s, flags=re.DOTALL)
+        s = _BLOCK_COMMENT_PATTERN.sub("", s)
         return s.strip()
 
     def _parse_single_analysis(
@@ -156,18 +224,16 @@ class AnalysisParser:
         performance_score = analysis_data.get("performance_score")
 
         # insights 파싱
-        insights = []
-        raw_insights = analysis_data.get("insights", [])
-
-        for insight_data in raw_insights:
-            if isinstance(insight_data, dict):
-                insight = AnalysisInsight(
-                    category=insight_data.get("category", "performance"),
-                    message=insight_data.get("message", "인사이트 메시지가 없습니다."),
-                    severity=insight_data.get("severity", "info"),
-                    recommendation=insight_data.get("recommendation")
-                )
-                insights.append(insight)
+        insights = [
+            AnalysisInsight(
+                category=insight_data.get("category", _DEFAULT_INSIGHT_CATEGORY),
+                message=insight_data.get("message", _DEFAULT_INSIGHT_MESSAGE),
+                severity=insight_data.get("severity", _DEFAULT_INSIGHT_SEVERITY),
+                recommendation=insight_data.get("recommendation")
+            )
+            for insight_data in analysis_data.get("insights", [])
+            if isinstance(insight_data, dict)
+        ]
 
         # performance_score 검증 및 변환
         if performance_score is not None:
@@ -227,10 +293,11 @@ class AnalysisParser:
         )
 
 
+# 상태를 변경하지 않는 클래스이므로 모듈 로드 시 한 번만 생성
+_ANALYSIS_PARSER = AnalysisParser()
+
+
 def get_analysis_parser() -> AnalysisParser:
     """AnalysisParser 인스턴스 반환 (싱글톤)"""
 
-    if not hasattr(get_analysis_parser, "_instance"):
-        get_analysis_parser._instance = AnalysisParser()
-
-    return get_analysis_parser._instance
\ No newline at end of file
+    return _ANALYSIS_PARSER
\ No newline at end of file
@@ -6,11 +6,64 @@ AI 분석용 프롬프트 관리 모듈
 """
 
 import json
+import re
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
 from app.schemas.analysis import LLMAnalysisInput, AnalysisType
 
+# 프롬프트 변수 공통 상수
+_NOT_AVAILABLE = "N/A"
+_COMPLETED = "완료"
+_IN_PROGRESS = "진행 중"
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 시계열 컨텍스트 끝에 붙는 고정 분석 가이드
+_STATIC_ANALYSIS_GUIDE = """**분석 시 고려사항**:
+- TPS 증가와 CPU/Memory 사용량 증가 패턴 분석
+- 응답시간 증가와 리소스 병목 구간 식별
+- 에러 발생 시점과 리소스 한계 도달 시점 비교
+- VUS 증가에 따른 시스템 부하 변화 패턴
+- **중요**: CPU가 낮은데 TPS 제한되면 스레드 풀이나 동시성 설정 병목 가능성
+
+**VU 패턴별 TPS 평가 가이드**:
+- constant-vus 패턴: 평균 TPS를 목표치와 직접 비교하여 성능 평가
+- ramping-vus/점진적 증가 패턴: **최대 TPS가 목표 TPS에 얼마나 가까운지가 핵심 지표**
+  * 점진적 증가에서 평균 TPS는 초반 낮은 VU로 인해 당연히 낮음 (정상적 현상)
+  * 최대 부하 상황(최대 VU)에서 달성한 최대 TPS를 목표 TPS와 비교 평가
+  * 예: 목표 100TPS, 최대 TPS 95TPS면 95% 달성으로 우수한 성능
+  * 평균 TPS가 목표보다 낮더라도 최대 TPS가 목표 근접하면 성공적"""
+
+# 템플릿 변수 패턴 ({name} 형태의 단순 치환만 사용)
+_PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+def _render_template(template: str, variables: Dict[str, Any]) -> str:
+    """
+    str.format 대신 정규식 한 번의 치환으로 템플릿 변수 치환
+
+    템플릿은 포맷 스펙 없이 {name} 치환만 사용하므로 format의 미니 언어 파싱 없이
+    템플릿을 한 번만 훑어 치환합니다. 치환된 값(테스트 제목, 시나리오 이름 등) 안의
+    {name} 문자열은 다시 치환하지 않고 그대로 유지합니다.
+    """
+
+    def _substitute(match: "re.Match[str]") -> str:
+        try:
+            return str(variables[match.group(1)])
+        except KeyError as e:
+            raise ValueError(f"Missing template variable: {e}")
+
+    return _PLACEHOLDER_PATTERN.sub(_substitute, template)
+
+
+@lru_cache(maxsize=256)
+def _format_timestamp(timestamp: datetime) -> str:
+    """테스트 시각 문자열 변환 (재시도 시 동일 시각 재사용)"""
+
+    return timestamp.strftime(_TIMESTAMP_FORMAT)
+
 
 class PromptManager:
     """AI 분석용 프롬프트 관리 클래스"""
@@ -23,7 +76,9 @@ class PromptManager:
             AnalysisType.ERROR_RATE: self._get_error_rate_prompt_template(),
             AnalysisType.RESOURCE_USAGE: self._get_resource_usage_prompt_template()
         }
-    
+
+        self.analysis_template = self._get_analysis_prompt_template()
+
     def get_prompt(self, analysis_type: AnalysisType, data: LLMAnalysisInput) -> str:
         """
         분석 유형에 맞는 프롬프트 생성
@@ -44,52 +99,49 @@ class PromptManager:
         prompt_vars = self._prepare_prompt_variables(data)
         
         # 템플릿에 변수 삽입
-        try:
-            return template.format(**prompt_vars)
-        except KeyError as e:
-            raise ValueError(f"Missing template variable: {e}")
-    
+        return _render_template(template, prompt_vars)
+
     def _prepare_prompt_variables(self, data: LLMAnalysisInput) -> Dict[str, Any]:
         """프롬프트 변수 준비"""
         
         # 기본 테스트 정보
         variables = {
             "test_title": data.configuration.title or "Unknown Test",
-            "test_duration": data.configuration.test_duration or "N/A",
-            "total_requests": data.configuration.total_requests or "N/A",
+            "test_duration": data.configuration.test_duration or _NOT_AVAILABLE,
+            "total_requests": data.configuration.total_requests or _NOT_AVAILABLE,
             "failed_requests": data.configuration.failed_requests or 0,
-            "target_tps": data.configuration.target_tps or "N/A",
-            "tested_at": data.tested_at.strftime("%Y-%m-%d %H:%M:%S") if data.tested_at else "N/A",
-            "is_completed": "완료" if data.is_completed else "진행 중"
+            "target_tps": data.configuration.target_tps or _NOT_AVAILABLE,
+            "tested_at": _format_timestamp(data.tested_at) if data.tested_at else _NOT_AVAILABLE,
+            "is_completed": _COMPLETED if data.is_completed else _IN_PROGRESS
         }
         
         # 전체 성능 메트릭
         if data.overall_tps:
             variables.update({
-                "overall_tps_avg": data.overall_tps.avg_value or "N/A",
-                "overall_tps_max": data.overall_tps.max_value or "N/A",
-                "overall_tps_min": data.overall_tps.min_value or "N/A"
+                "overall_tps_avg": data.overall_tps.avg_value or _NOT_AVAILABLE,
+                "overall_tps_max": data.overall_tps.max_value or _NOT_AVAILABLE,
+                "overall_tps_min": data.overall_tps.min_value or _NOT_AVAILABLE
             })
         else:
             variables.update({
-                "overall_tps_avg": "N/A",
-                "overall_tps_max": "N/A", 
-                "overall_tps_min": "N/A"
+                "overall_tps_avg": _NOT_AVAILABLE,
+                "overall_tps_max": _NOT_AVAILABLE, 
+                "overall_tps_min": _NOT_AVAILABLE
             })
         
         if data.overall_response_time:
             variables.update({
-                "overall_rt_avg": data.overall_response_time.avg_value or "N/A",
-                "overall_rt_max": data.overall_response_time.max_value or "N/A",
-                "overall_rt_min": data.overall_response_time.min_value or "N/A",
-                "overall_rt_p50": data.overall_response_time.p50 or "N/A",
-                "overall_rt_p95": data.overall_response_time.p95 or "N/A",
-                "overall_rt_p99": data.overall_response_time.p99 or "N/A"
+                "overall_rt_avg": data.overall_response_time.avg_value or _NOT_AVAILABLE,
+                "overall_rt_max": data.overall_response_time.max_value or _NOT_AVAILABLE,
+                "overall_rt_min": data.overall_response_time.min_value or _NOT_AVAILABLE,
+                "overall_rt_p50": data.overall_response_time.p50 or _NOT_AVAILABLE,
+                "overall_rt_p95": data.overall_response_time.p95 or _NOT_AVAILABLE,
+                "overall_rt_p99": data.overall_response_time.p99 or _NOT_AVAILABLE
             })
         else:
             variables.update({
-                "overall_rt_avg": "N/A", "overall_rt_max": "N/A", "overall_rt_min": "N/A",
-                "overall_rt_p50": "N/A", "overall_rt_p95": "N/A", "overall_rt_p99": "N/A"
+                "overall_rt_avg": _NOT_AVAILABLE, "overall_rt_max": _NOT_AVAILABLE, "overall_rt_min": _NOT_AVAILABLE,
+                "overall_rt_p50": _NOT_AVAILABLE, "overall_rt_p95": _NOT_AVAILABLE, "overall_rt_p99": _NOT_AVAILABLE
             })
         
         # 에러율 계산
@@ -97,26 +149,16 @@ class PromptManager:
             error_rate = (data.configuration.failed_requests / data.configuration.total_requests) * 100
             variables["error_rate"] = f"{error_rate:.2f}%"
         else:
-            variables["error_rate"] = "N/A"
+            variables["error_rate"] = _NOT_AVAILABLE
         
         # 시나리오 정보
-        scenario_count = len(data.scenarios)
-        variables["scenario_count"] = scenario_count
-        
-        scenario_details = []
-        for i, scenario in enumerate(data.scenarios[:5], 1):  # 최대 5개까지만 표시
-            scenario_info = {
-                "name": scenario.scenario_name,
-                "executor": scenario.executor,
-                "total_requests": scenario.total_requests or "N/A",
-                "failed_requests": scenario.failed_requests or 0,
-                "think_time": scenario.think_time,
-                "endpoint_method": scenario.endpoint.method if scenario.endpoint else "N/A",
-                "endpoint_path": scenario.endpoint.path if scenario.endpoint else "N/A"
-            }
-            scenario_details.append(f"{i}. {scenario_info['name']}: {scenario_info['endpoint_method']} {scenario_info['endpoint_path']}")
-        
-        variables["scenario_details"] = "\n".join(scenario_details) if scenario_details else "시나리오 정보 없음"
+        scenarios = data.scenarios
+        variables["scenario_count"] = len(scenarios)
+
+        if not scenarios:
+            variables["scenario_details"] = "시나리오 정보 없음"
+        else:
+            variables["scenario_details"] = self._format_scenario_details(scenarios)
         
         # 리소스 사용량 정보
         if data.resource_usage:
@@ -139,6 +181,18 @@ class PromptManager:
         
         return variables
     
+    def _format_scenario_details(self, scenarios: List[Any]) -> str:
+        """시나리오 요약 문자열 생성 (최대 5개까지만 표시)"""
+
+        scenario_details = []
+        for i, scenario in enumerate(islice(scenarios, 5), 1):
+            endpoint = scenario.endpoint
+            endpoint_method = endpoint.method if endpoint else _NOT_AVAILABLE
+            endpoint_path = endpoint.path if endpoint else _NOT_AVAILABLE
+            scenario_details.append(f"{i}. {scenario.scenario_name}: {endpoint_method} {endpoint_path}")
+
+        return "\n".join(scenario_details)
+
     def _get_comprehensive_prompt_template(self) -> str:
         """종합 분석 프롬프트 템플릿"""
 
@@ -266,8 +320,6 @@ TPS 목표 달성도 평가 - VU 패턴을 고려하여 적절한 TPS 지표로
         # 시계열 데이터 문자열 생성
         timeseries_context = self._prepare_timeseries_context(data)
 
-        template = self._get_analysis_prompt_template()
-
         # 시계열 컨텍스트를 프롬프트 변수에 추가
         prompt_vars["timeseries_context"] = timeseries_context
 
@@ -281,10 +333,7 @@ TPS 목표 달성도 평가 - VU 패턴을 고려하여 적절한 TPS 지표로
         json_template = '{\n  "comprehensive": ' + comprehensive_part + ',\n  "response_time": ' + response_time_part + ',\n  "tps": ' + tps_part + ',\n  "error_rate": ' + error_rate_part + ',\n  "resource_usage": ' + resource_usage_part + '\n}'
         prompt_vars["json_template"] = json_template
 
-        try:
-            return template.format(**prompt_vars)
-        except KeyError as e:
-            raise ValueError(f"Missing template variable: {e}")
+        return _render_template(self.analysis_template, prompt_vars)
 
     def _prepare_timeseries_context(self, data: LLMAnalysisInput) -> str:
         """시계열 데이터를 AI 분석용 컨텍스트로 변환"""
@@ -300,20 +349,24 @@ TPS 목표 달성도 평가 - VU 패턴을 고려하여 적절한 TPS 지표로
             context_parts.append("**k6 성능 시계열 데이터** (노이즈 제거 후, 5초 간격):")
 
             if overall_data:
-                # 전체 성능 패턴 요약
+                # 전체 성능 패턴 요약 (메트릭별 최소/최대/평균을 한 번씩만 계산)
                 tps_values = [d.get('tps', 0) for d in overall_data if d.get('tps') is not None]
                 response_times = [d.get('avg_response_time', 0) for d in overall_data if d.get('avg_response_time') is not None]
                 error_rates = [d.get('error_rate', 0) for d in overall_data if d.get('error_rate') is not None]
                 vus_values = [d.get('vus', 0) for d in overall_data if d.get('vus') is not None]
 
                 if tps_values:
-                    context_parts.append(f"- TPS 변화: {min(tps_values):.1f} → {max(tps_values):.1f} (평균 {sum(tps_values)/len(tps_values):.1f})")
+                    tps_min, tps_max, tps_avg = min(tps_values), max(tps_values), sum(tps_values) / len(tps_values)
+                    context_parts.append(f"- TPS 변화: {tps_min:.1f} → {tps_max:.1f} (평균 {tps_avg:.1f})")
                 if response_times:
-                    context_parts.append(f"- 응답시간 변화: {min(response_times):.1f}ms → {max(response_times):.1f}ms (평균 {sum(response_times)/len(response_times):.1f}ms)")
+                    rt_min, rt_max, rt_avg = min(response_times), max(response_times), sum(response_times) / len(response_times)
+                    context_parts.append(f"- 응답시간 변화: {rt_min:.1f}ms → {rt_max:.1f}ms (평균 {rt_avg:.1f}ms)")
                 if error_rates:
-                    context_parts.append(f"- 에러율 변화: {min(error_rates):.2f}% → {max(error_rates):.2f}% (평균 {sum(error_rates)/len(error_rates):.2f}%)")
+                    error_min, error_max, error_avg = min(error_rates), max(error_rates), sum(error_rates) / len(error_rates)
+                    context_parts.append(f"- 에러율 변화: {error_min:.2f}% → {error_max:.2f}% (평균 {error_avg:.2f}%)")
                 if vus_values:
-                    context_parts.append(f"- VUS 변화: {min(vus_values)} → {max(vus_values)} (평균 {sum(vus_values)/len(vus_values):.0f})")
+                    vus_min, vus_max, vus_avg = min(vus_values), max(vus_values), sum(vus_values) / len(vus_values)
+                    context_parts.append(f"- VUS 변화: {vus_min} → {vus_max} (평균 {vus_avg:.0f})")
 
                 context_parts.append(f"- 안정 구간 측정 포인트: {len(overall_data)}개")
 
@@ -334,7 +387,7 @@ TPS 목표 달성도 평가 - VU 패턴을 고려하여 적절한 TPS 지표로
         # 리소스 사용량 시계열 데이터
         if data.resource_usage:
             context_parts.append("**리소스 시계열 데이터**:")
-            for idx, resource in enumerate(data.resource_usage[:3], 1):  # 최대 3개까지
+            for idx, resource in enumerate(islice(data.resource_usage, 3), 1):  # 최대 3개까지
                 context_parts.append(f"{idx}. Pod: {resource.pod_name} ({resource.service_type})")
                 context_parts.append(f"   - CPU 사용량 변화: 평균 {resource.avg_cpu_percent:.1f}% (최대 {resource.max_cpu_percent:.1f}%)")
                 context_parts.append(f"   - Memory 사용량 변화: 평균 {resource.avg_memory_percent:.1f}% (최대 {resource.max_memory_percent:.1f}%)")
@@ -345,23 +398,8 @@ TPS 목표 달성도 평가 - VU 패턴을 고려하여 적절한 TPS 지표로
                     context_parts.append(f"   - 측정 포인트: {data_count}개 (리소스-성능 상관관계 분석 가능)")
             context_parts.append("")
 
-        # 상관관계 분석 가이드
-        context_parts.append("**분석 시 고려사항**:")
-        context_parts.append("- TPS 증가와 CPU/Memory 사용량 증가 패턴 분석")
-        context_parts.append("- 응답시간 증가와 리소스 병목 구간 식별")
-        context_parts.append("- 에러 발생 시점과 리소스 한계 도달 시점 비교")
-        context_parts.append("- VUS 증가에 따른 시스템 부하 변화 패턴")
-        context_parts.append("- **중요**: CPU가 낮은데 TPS 제한되면 스레드 풀이나 동시성 설정 병목 가능성")
-
-        # VU 패턴별 TPS 평가 가이드 추가
-        context_parts.append("")
-        context_parts.append("**VU 패턴별 TPS 평가 가이드**:")
-        context_parts.append("- constant-vus 패턴: 평균 TPS를 목표치와 직접 비교하여 성능 평가")
-        context_parts.append("- ramping-vus/점진적 증가 패턴: **최대 TPS가 목표 TPS에 얼마나 가까운지가 핵심 지표**")
-        context_parts.append("  * 점진적 증가에서 평균 TPS는 초반 낮은 VU로 인해 당연히 낮음 (정상적 현상)")
-        context_parts.append("  * 최대 부하 상황(최대 VU)에서 달성한 최대 TPS를 목표 TPS와 비교 평가")
-        context_parts.append("  * 예: 목표 100TPS, 최대 TPS 95TPS면 95% 달성으로 우수한 성능")
-        context_parts.append("  * 평균 TPS가 목표보다 낮더라도 최대 TPS가 목표 근접하면 성공적")
+        # 상관관계 분석 가이드 + VU 패턴별 TPS 평가 가이드 (고정 문구)
+        context_parts.append(_STATIC_ANALYSIS_GUIDE)
 
         # TPS-VU 상관관계 기반 동적 가이드 추가
         self._add_dynamic_tps_guidance(context_parts, data)
@@ -6,12 +6,138 @@ AI 분석에 적합한 형태로 전처리합니다.
 """
 
 import logging
+from dataclasses import dataclass
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple
-from statistics import mean, stdev
+from typing import List, Dict, Any, Optional, Tuple, Union
+from statistics import mean
+
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+    # numba 미설치 시 NumPy 구현 그대로 사용
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
 
 logger = logging.getLogger(__name__)
 
+# 시간순 정렬 키
+_TIMESTAMP_KEY = itemgetter('timestamp')
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _welford_mean_std(values: np.ndarray, start: int, end: int) -> Tuple[int, float, float]:
+        """[start, end) 구간의 NaN을 제외한 개수/평균/표본표준편차를 한 번의 순회로 계산 (Welford)"""
+        count = 0
+        mean_val = 0.0
+        m2 = 0.0
+
+        for i in range(start, end):
+            value = values[i]
+            if np.isnan(value):
+                continue
+            count += 1
+            delta = value - mean_val
+            mean_val += delta / count
+            m2 += delta * (value - mean_val)
+
+        std_val = np.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+        return count, mean_val, std_val
+else:
+    def _welford_mean_std(values: np.ndarray, start: int, end: int) -> Tuple[int, float, float]:
+        """[start, end) 구간의 NaN을 제외한 개수/평균/표본표준편차 (numba 미설치 시 NumPy 벡터 연산)"""
+        window = values[start:end]
+        count = int(np.count_nonzero(~np.isnan(window)))
+        if count == 0:
+            return 0, 0.0, 0.0
+
+        mean_val = float(np.nanmean(window))
+        std_val = float(np.nanstd(window, ddof=1)) if count > 1 else 0.0
+        return count, mean_val, std_val
+
+
+@njit(cache=True)
+def _trim_and_zscore_indices(values: np.ndarray, start: int, end: int, threshold: float) -> np.ndarray:
+    """
+    [start, end) 구간 안에서 표준편차 기준 이상치를 제외하고 유지할 인덱스 계산
+
+    NaN은 메트릭 값이 없는 포인트로 간주하여 통계 계산에서 제외합니다.
+    유효 값이 5개 미만이거나 표준편차가 0이면 구간 전체를 유지합니다.
+    """
+    window_indices = np.arange(start, end)
+    count, mean_val, std_val = _welford_mean_std(values, start, end)
+
+    if count < 5 or std_val == 0:  # 표준편차가 0이면 모든 값이 같음
+        return window_indices
+
+    # NaN과의 비교는 항상 False이므로 값이 없는 포인트는 자동으로 제외됨
+    keep = np.abs(values[start:end] - mean_val) <= threshold * std_val
+    if not keep.any():
+        return window_indices
+    return window_indices[keep]
+
+
+@dataclass
+class K6Columns:
+    """k6 시계열 데이터의 컬럼(SoA) 표현 - 메트릭별 연속 배열과 원본 행 참조"""
+
+    rows: List[Dict[str, Any]]
+    timestamp: np.ndarray
+    tps: np.ndarray
+    avg_response_time: np.ndarray
+    error_rate: np.ndarray
+    vus: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> "K6Columns":
+        """행(dict) 리스트를 한 번 순회하여 컬럼 배열 생성 (값이 없으면 NaN)"""
+
+        n = len(rows)
+        timestamp = np.empty(n, dtype=object)
+        tps = np.empty(n, dtype=np.float64)
+        avg_response_time = np.empty(n, dtype=np.float64)
+        error_rate = np.empty(n, dtype=np.float64)
+        vus = np.empty(n, dtype=np.float64)
+        nan = np.nan
+
+        for i, d in enumerate(rows):
+            get = d.get
+            timestamp[i] = get('timestamp')
+            value = get('tps')
+            tps[i] = nan if value is None else value
+            value = get('avg_response_time')
+            avg_response_time[i] = nan if value is None else value
+            value = get('error_rate')
+            error_rate[i] = nan if value is None else value
+            value = get('vus')
+            vus[i] = nan if value is None else value
+
+        return cls(rows, timestamp, tps, avg_response_time, error_rate, vus)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def take(self, indices: np.ndarray) -> "K6Columns":
+        """인덱스 배열 순서대로 선택한 새 컬럼 묶음 반환"""
+
+        rows = self.rows
+        return K6Columns(
+            [rows[i] for i in indices.tolist()],
+            self.timestamp[indices],
+            self.tps[indices],
+            self.avg_response_time[indices],
+            self.error_rate[indices],
+            self.vus[indices]
+        )
+
 
 class TimeseriesDataProcessor:
     """시계열 데이터 전처리 클래스"""
@@ -47,16 +173,20 @@ class TimeseriesDataProcessor:
 
             logger.info(f"Processing k6 timeseries: {len(overall_data)} overall points, {len(scenario_data)} scenario points")
 
+            # 메트릭을 컬럼 배열로 한 번만 변환
+            overall_columns = K6Columns.from_rows(overall_data)
+
             # 노이즈 제거 적용
             if remove_noise and overall_data:
-                overall_data = self._remove_noise_from_timeseries(overall_data)
-                scenario_data = self._remove_noise_from_timeseries(scenario_data) if scenario_data else []
+                overall_columns = self._remove_noise_from_timeseries(overall_columns)
+                if scenario_data:
+                    scenario_data = self._remove_noise_from_timeseries(K6Columns.from_rows(scenario_data)).rows
 
             # 분석용 컨텍스트 생성
-            context = self._generate_k6_analysis_context(overall_data, scenario_data)
+            context = self._generate_k6_analysis_context(overall_columns, scenario_data)
 
             # 전처리된 데이터 결합
-            processed_data = overall_data + scenario_data
+            processed_data = overall_columns.rows + scenario_data
 
             logger.info(f"Processed k6 timeseries: {len(processed_data)} points after noise removal")
 
@@ -85,27 +215,12 @@ class TimeseriesDataProcessor:
             return [], "리소스 사용량 데이터가 없습니다."
 
         try:
-            processed_resources = []
-
-            for resource in resource_usage_data:
-                pod_name = resource.get('pod_name', 'unknown')
-                service_type = resource.get('service_type', 'unknown')
-                resource_data = resource.get('resource_data', [])
-
-                if not resource_data:
-                    continue
-
-                # 노이즈 제거 적용
-                if remove_noise:
-                    resource_data = self._remove_noise_from_resource_data(resource_data)
-
-                processed_resource = {
-                    'pod_name': pod_name,
-                    'service_type': service_type,
-                    'resource_data': resource_data
-                }
-
-                processed_resources.append(processed_resource)
+            # Pod별 전처리는 GIL을 잡는 파이썬 연산이므로 스레드 없이 순서대로 처리
+            processed_resources = [
+                processed
+                for processed in (self._process_one_pod(resource, remove_noise) for resource in resource_usage_data)
+                if processed is not None
+            ]
 
             # 분석용 컨텍스트 생성
             context = self._generate_resource_analysis_context(processed_resources)
@@ -118,35 +233,64 @@ class TimeseriesDataProcessor:
             logger.error(f"Error processing resource timeseries data: {e}")
             return resource_usage_data, "리소스 시계열 데이터 처리 중 오류가 발생했습니다."
 
-    def _remove_noise_from_timeseries(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _process_one_pod(self, resource: Dict[str, Any], remove_noise: bool) -> Optional[Dict[str, Any]]:
+        """Pod 하나의 리소스 시계열 전처리 (데이터가 없으면 None)"""
+
+        resource_data = resource.get('resource_data', [])
+        if not resource_data:
+            return None
+
+        # 노이즈 제거 적용
+        if remove_noise:
+            resource_data = self._remove_noise_from_resource_data(resource_data)
+
+        return {
+            'pod_name': resource.get('pod_name', 'unknown'),
+            'service_type': resource.get('service_type', 'unknown'),
+            'resource_data': resource_data
+        }
+
+    def _remove_noise_from_timeseries(self, columns: K6Columns) -> K6Columns:
         """시계열 데이터에서 노이즈 제거"""
 
-        if len(data) < 10:  # 데이터가 너무 적으면 노이즈 제거 안함
-            return data
+        if len(columns) < 10:  # 데이터가 너무 적으면 노이즈 제거 안함
+            return columns
 
-        # 시간순 정렬
-        sorted_data = sorted(data, key=lambda x: x['timestamp'])
+        total_points = len(columns)
+
+        # 시간순 정렬 순서 계산 (k6 데이터는 대부분 이미 정렬되어 있으므로 O(n) 확인 후 필요할 때만 정렬)
+        timestamps = columns.timestamp
+        if np.all(timestamps[:-1] <= timestamps[1:]):
+            order = np.arange(total_points)
+            tps_values = columns.tps
+        else:
+            order = np.argsort(timestamps, kind='stable')
+            tps_values = columns.tps[order]
+
+        # 초기/종료 구간 계산
+        start_idx, end_idx = self._get_trim_window(total_points)
+
+        # 구간 제거 + 이상치 제거 (TPS 기준) 후 한 번만 선택
+        kept = _trim_and_zscore_indices(tps_values, start_idx, end_idx, self.outlier_threshold)
+        cleaned_columns = columns.take(order[kept])
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Noise removal: {total_points} -> {end_idx - start_idx} -> {len(cleaned_columns)} points")
+
+        return cleaned_columns
+
+    def _get_trim_window(self, total_points: int) -> Tuple[int, int]:
+        """초기/종료 구간을 제외한 [start, end) 인덱스 계산"""
 
-        # 초기/종료 구간 제거
-        total_points = len(sorted_data)
         start_trim = int(total_points * self.startup_trim_percentage)
         end_trim = int(total_points * self.shutdown_trim_percentage)
 
         if start_trim + end_trim >= total_points:
             # 너무 많이 제거하게 되면 중간 50% 구간만 사용
-            start_idx = int(total_points * 0.25)
-            end_idx = int(total_points * 0.75)
-            trimmed_data = sorted_data[start_idx:end_idx]
-        else:
-            end_idx = total_points - end_trim if end_trim > 0 else total_points
-            trimmed_data = sorted_data[start_trim:end_idx]
+            return int(total_points * 0.25), int(total_points * 0.75)
 
-        # 이상치 제거 (TPS 기준)
-        cleaned_data = self._remove_outliers(trimmed_data, 'tps')
-
-        logger.debug(f"Noise removal: {total_points} -> {len(trimmed_data)} -> {len(cleaned_data)} points")
-
-        return cleaned_data
+        end_idx = total_points - end_trim if end_trim > 0 else total_points
+        return start_trim, end_idx
 
     def _remove_noise_from_resource_data(self, resource_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """리소스 데이터에서 노이즈 제거"""
@@ -154,123 +298,96 @@ class TimeseriesDataProcessor:
         if len(resource_data) < 10:
             return resource_data
 
-        # 시간순 정렬
-        sorted_data = sorted(resource_data, key=lambda x: x['timestamp'])
+        # 시간순 정렬 (이미 정렬된 경우 생략)
+        timestamps = [_TIMESTAMP_KEY(d) for d in resource_data]
+        if all(previous <= current for previous, current in zip(timestamps, timestamps[1:])):
+            sorted_data = resource_data
+        else:
+            sorted_data = sorted(resource_data, key=_TIMESTAMP_KEY)
 
         # 초기/종료 구간 제거
         total_points = len(sorted_data)
-        start_trim = int(total_points * self.startup_trim_percentage)
-        end_trim = int(total_points * self.shutdown_trim_percentage)
+        start_idx, end_idx = self._get_trim_window(total_points)
+        trimmed_data = sorted_data[start_idx:end_idx]
 
-        if start_trim + end_trim >= total_points:
-            start_idx = int(total_points * 0.25)
-            end_idx = int(total_points * 0.75)
-            trimmed_data = sorted_data[start_idx:end_idx]
-        else:
-            end_idx = total_points - end_trim if end_trim > 0 else total_points
-            trimmed_data = sorted_data[start_trim:end_idx]
-
-        logger.debug(f"Resource noise removal: {total_points} -> {len(trimmed_data)} points")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Resource noise removal: {total_points} -> {len(trimmed_data)} points")
 
         return trimmed_data
 
-    def _remove_outliers(self, data: List[Dict[str, Any]], metric_key: str) -> List[Dict[str, Any]]:
-        """이상치 제거 (표준편차 기준)"""
-
-        if len(data) < 5:
-            return data
-
-        try:
-            values = [d.get(metric_key, 0) for d in data if d.get(metric_key) is not None]
-
-            if len(values) < 5:
-                return data
-
-            mean_val = mean(values)
-            std_val = stdev(values)
-
-            if std_val == 0:  # 표준편차가 0이면 모든 값이 같음
-                return data
-
-            # 표준편차 기준 이상치 제거
-            filtered_data = []
-            for d in data:
-                value = d.get(metric_key, 0)
-                if value is not None:
-                    z_score = abs(value - mean_val) / std_val
-                    if z_score <= self.outlier_threshold:
-                        filtered_data.append(d)
-
-            return filtered_data if filtered_data else data
-
-        except Exception as e:
-            logger.warning(f"Error removing outliers: {e}")
-            return data
-
     def _generate_k6_analysis_context(
         self,
-        overall_data: List[Dict[str, Any]],
+        overall_columns: K6Columns,
         scenario_data: List[Dict[str, Any]]
     ) -> str:
         """k6 데이터 분석용 컨텍스트 생성"""
 
         context_parts = []
+        append = context_parts.append
 
-        if overall_data:
-            # 전체 성능 패턴 분석
-            tps_values = [d.get('tps', 0) for d in overall_data if d.get('tps') is not None]
-            response_times = [d.get('avg_response_time', 0) for d in overall_data if d.get('avg_response_time') is not None]
-            error_rates = [d.get('error_rate', 0) for d in overall_data if d.get('error_rate') is not None]
-            vus_values = [d.get('vus', 0) for d in overall_data if d.get('vus') is not None]
+        if len(overall_columns):
+            # 전체 성능 패턴 분석 (값이 없는 포인트 제외)
+            tps_values = self._drop_nan(overall_columns.tps)
+            response_times = self._drop_nan(overall_columns.avg_response_time)
+            error_rates = self._drop_nan(overall_columns.error_rate)
+            vus_values = self._drop_nan(overall_columns.vus)
 
-            context_parts.append("**k6 성능 시계열 패턴 분석**:")
+            append("**k6 성능 시계열 패턴 분석**:")
 
-            if tps_values:
-                tps_trend = self._analyze_trend(tps_values)
-                context_parts.append(f"- TPS 변화 패턴: {tps_trend} (최소 {min(tps_values):.1f} → 최대 {max(tps_values):.1f})")
+            if tps_values.size:
+                tps_min, tps_max, tps_trend = tps_values.min(), tps_values.max(), self._analyze_trend(tps_values)
+                append(f"- TPS 변화 패턴: {tps_trend} (최소 {tps_min:.1f} → 최대 {tps_max:.1f})")
 
-            if response_times:
-                rt_trend = self._analyze_trend(response_times)
-                context_parts.append(f"- 응답시간 변화 패턴: {rt_trend} (최소 {min(response_times):.1f}ms → 최대 {max(response_times):.1f}ms)")
+            if response_times.size:
+                rt_min, rt_max, rt_trend = response_times.min(), response_times.max(), self._analyze_trend(response_times)
+                append(f"- 응답시간 변화 패턴: {rt_trend} (최소 {rt_min:.1f}ms → 최대 {rt_max:.1f}ms)")
 
-            if error_rates:
-                error_trend = self._analyze_trend(error_rates)
-                context_parts.append(f"- 에러율 변화 패턴: {error_trend} (최소 {min(error_rates):.2f}% → 최대 {max(error_rates):.2f}%)")
+            if error_rates.size:
+                error_min, error_max, error_trend = error_rates.min(), error_rates.max(), self._analyze_trend(error_rates)
+                append(f"- 에러율 변화 패턴: {error_trend} (최소 {error_min:.2f}% → 최대 {error_max:.2f}%)")
 
-            if vus_values:
+            if vus_values.size:
                 vus_trend = self._analyze_trend(vus_values)
-                vus_pattern_info = self._analyze_vus_pattern(vus_values)
-                context_parts.append(f"- 가상 사용자 변화: {vus_trend} (최소 {min(vus_values)} → 최대 {max(vus_values)})")
-                context_parts.append(f"  * VU 패턴 분석: {vus_pattern_info}")
+                vus_pattern_info = self._analyze_vus_pattern(vus_values.tolist())
+                min_vus, max_vus = int(vus_values.min()), int(vus_values.max())
+                append(f"- 가상 사용자 변화: {vus_trend} (최소 {min_vus} → 최대 {max_vus})")
+                append(f"  * VU 패턴 분석: {vus_pattern_info}")
 
                 # VU 패턴 정보를 로그로 출력
-                logger.info(f"VU Pattern Analysis - Trend: {vus_trend}, Pattern: {vus_pattern_info}, Range: {min(vus_values)}-{max(vus_values)}")
+                logger.info(f"VU Pattern Analysis - Trend: {vus_trend}, Pattern: {vus_pattern_info}, Range: {min_vus}-{max_vus}")
 
                 # TPS-VU 상관관계 분석 (점진적 증가 패턴인 경우)
                 if "ramping-vus" in vus_pattern_info or "점진적 증가" in vus_pattern_info:
-                    correlation_analysis = self._analyze_tps_vu_correlation(overall_data)
+                    correlation_analysis = self._analyze_tps_vu_correlation(overall_columns)
                     if correlation_analysis["correlation"] != "insufficient_data":
-                        context_parts.append(f"  * TPS-VU 상관관계: {correlation_analysis['pattern']} (상관계수 {correlation_analysis['coefficient']})")
+                        append(f"  * TPS-VU 상관관계: {correlation_analysis['pattern']} (상관계수 {correlation_analysis['coefficient']})")
                         logger.info(f"TPS-VU Correlation Analysis: {correlation_analysis}")
 
-            context_parts.append(f"- 안정 구간 데이터 포인트: {len(overall_data)}개 (노이즈 제거 후)")
+            append(f"- 안정 구간 데이터 포인트: {len(overall_columns)}개 (노이즈 제거 후)")
 
         # 시나리오별 데이터가 있는 경우
         if scenario_data:
             scenarios = set(d.get('scenario_name') for d in scenario_data if d.get('scenario_name'))
-            context_parts.append(f"- 시나리오별 분석 가능: {len(scenarios)}개 시나리오")
+            append(f"- 시나리오별 분석 가능: {len(scenarios)}개 시나리오")
 
-        context_parts.append("")
+        append("")
 
         return "\n".join(context_parts)
 
+    @staticmethod
+    def _drop_nan(values: np.ndarray) -> np.ndarray:
+        """NaN(값 없음)을 제외한 배열 반환"""
+
+        return values[~np.isnan(values)]
+
     def _generate_resource_analysis_context(self, processed_resources: List[Dict[str, Any]]) -> str:
         """리소스 데이터 분석용 컨텍스트 생성"""
 
         context_parts = []
+        append = context_parts.append
 
         if processed_resources:
-            context_parts.append("**리소스 사용량 시계열 패턴 분석**:")
+            append("**리소스 사용량 시계열 패턴 분석**:")
 
             for resource in processed_resources:
                 pod_name = resource['pod_name']
@@ -281,42 +398,63 @@ class TimeseriesDataProcessor:
                     continue
 
                 # CPU/Memory 사용 패턴 분석
-                cpu_percentages = [d['usage']['cpu_percent'] for d in resource_data if 'usage' in d]
-                memory_percentages = [d['usage']['memory_percent'] for d in resource_data if 'usage' in d]
+                cpu_percentages, memory_percentages = self._extract_usage_arrays(resource_data)
 
-                context_parts.append(f"- {pod_name} ({service_type}):")
+                append(f"- {pod_name} ({service_type}):")
 
-                if cpu_percentages:
-                    cpu_trend = self._analyze_trend(cpu_percentages)
-                    context_parts.append(f"  * CPU 사용 패턴: {cpu_trend} (범위: {min(cpu_percentages):.1f}% - {max(cpu_percentages):.1f}%)")
+                if cpu_percentages.size:
+                    cpu_min, cpu_max, cpu_trend = cpu_percentages.min(), cpu_percentages.max(), self._analyze_trend(cpu_percentages)
+                    append(f"  * CPU 사용 패턴: {cpu_trend} (범위: {cpu_min:.1f}% - {cpu_max:.1f}%)")
 
-                if memory_percentages:
-                    memory_trend = self._analyze_trend(memory_percentages)
-                    context_parts.append(f"  * Memory 사용 패턴: {memory_trend} (범위: {min(memory_percentages):.1f}% - {max(memory_percentages):.1f}%)")
+                if memory_percentages.size:
+                    memory_min, memory_max, memory_trend = memory_percentages.min(), memory_percentages.max(), self._analyze_trend(memory_percentages)
+                    append(f"  * Memory 사용 패턴: {memory_trend} (범위: {memory_min:.1f}% - {memory_max:.1f}%)")
 
-                context_parts.append(f"  * 측정 포인트: {len(resource_data)}개 (노이즈 제거 후)")
+                append(f"  * 측정 포인트: {len(resource_data)}개 (노이즈 제거 후)")
 
-        context_parts.append("")
+        append("")
 
         return "\n".join(context_parts)
 
-    def _analyze_trend(self, values: List[float]) -> str:
+    def _extract_usage_arrays(self, resource_data: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """CPU/Memory 사용률을 한 번의 순회로 배열에 적재 (값이 없는 포인트는 제외)"""
+
+        n = len(resource_data)
+        cpu = np.empty(n, dtype=np.float64)
+        memory = np.empty(n, dtype=np.float64)
+        nan = np.nan
+        count = 0
+
+        for d in resource_data:
+            usage = d.get('usage')
+            if usage is None:
+                continue
+            value = usage['cpu_percent']
+            cpu[count] = nan if value is None else value
+            value = usage['memory_percent']
+            memory[count] = nan if value is None else value
+            count += 1
+
+        return self._drop_nan(cpu[:count]), self._drop_nan(memory[:count])
+
+    def _analyze_trend(self, values: Union[List[float], np.ndarray]) -> str:
         """수치 리스트의 변화 추세 분석"""
 
         if len(values) < 3:
             return "안정적"
 
-        # 시간에 따른 변화율 계산
-        first_half = values[:len(values)//2]
-        second_half = values[len(values)//2:]
-
-        first_avg = mean(first_half)
-        second_avg = mean(second_half)
+        # 최소제곱 기울기로 전체 구간의 변화량 계산
+        values = np.asarray(values, dtype=np.float64)
+        n = values.size
+        x_centered = np.arange(n, dtype=np.float64) - (n - 1) / 2.0
+        mean_val = float(values.mean())
+        slope = float((x_centered * (values - mean_val)).sum() / (x_centered * x_centered).sum())
 
-        if first_avg == 0:
-            return "증가" if second_avg > first_avg else "안정적"
+        if mean_val == 0:
+            return "증가" if slope > 0 else "안정적"
 
-        change_rate = ((second_avg - first_avg) / first_avg) * 100
+        # 평균 대비 전체 구간 변화율
+        change_rate = (slope * n / mean_val) * 100
 
         if change_rate > 10:
             return "증가 추세"
@@ -344,11 +482,10 @@ class TimeseriesDataProcessor:
         ramping_points = 0
         stable_points = 0
 
-        for i in range(1, len(vus_values)):
-            diff = abs(vus_values[i] - vus_values[i-1])
-            if diff <= 1:  # VU 차이가 1 이하면 안정적
+        for previous, current in zip(vus_values, vus_values[1:]):
+            if abs(current - previous) <= 1:  # VU 차이가 1 이하면 안정적
                 stable_points += 1
-            elif diff > 1:  # VU 차이가 1 초과면 변화
+            else:  # VU 차이가 1 초과면 변화
                 ramping_points += 1
 
         # 패턴 판정
@@ -392,28 +529,21 @@ class TimeseriesDataProcessor:
 
         return min(stages, 5)  # 최대 5단계까지만
 
-    def _analyze_tps_vu_correlation(self, overall_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_tps_vu_correlation(self, overall_columns: K6Columns) -> Dict[str, Any]:
         """TPS와 VU의 상관관계 분석"""
 
-        if len(overall_data) < 10:
+        if len(overall_columns) < 10:
             return {"correlation": "insufficient_data", "coefficient": 0.0, "pattern": "unknown"}
 
-        # VU와 TPS 데이터 추출
-        valid_pairs = []
-        for point in overall_data:
-            vu = point.get('vus', 0)
-            tps = point.get('tps', 0)
-            if vu > 0 and tps > 0:
-                valid_pairs.append((vu, tps))
-
-        if len(valid_pairs) < 5:
+        # VU와 TPS가 모두 양수인 포인트만 사용 (NaN 비교는 False)
+        valid = (overall_columns.vus > 0) & (overall_columns.tps > 0)
+        if np.count_nonzero(valid) < 5:
             return {"correlation": "insufficient_data", "coefficient": 0.0, "pattern": "unknown"}
 
         # 피어슨 상관계수 계산
-        import numpy as np
         try:
-            vus = [pair[0] for pair in valid_pairs]
-            tps_values = [pair[1] for pair in valid_pairs]
+            vus = overall_columns.vus[valid]
+            tps_values = overall_columns.tps[valid]
 
             correlation_coefficient = np.corrcoef(vus, tps_values)[0, 1]
 
@@ -432,8 +562,8 @@ class TimeseriesDataProcessor:
                 pattern = "bottlenecked"  # 명백한 병목 존재
 
             # 선형성 분석 (VU 대비 TPS 기울기)
-            vu_range = max(vus) - min(vus)
-            tps_range = max(tps_values) - min(tps_values)
+            vu_range = vus.max() - vus.min()
+            tps_range = tps_values.max() - tps_values.min()
 
             if vu_range > 0:
                 scaling_ratio = tps_range / vu_range
@@ -442,11 +572,11 @@ class TimeseriesDataProcessor:
 
             return {
                 "correlation": correlation_type,
-                "coefficient": round(correlation_coefficient, 3),
+                "coefficient": round(float(correlation_coefficient), 3),
                 "pattern": pattern,
-                "scaling_ratio": round(scaling_ratio, 2),
-                "vu_range": f"{min(vus)}-{max(vus)}",
-                "tps_range": f"{min(tps_values):.1f}-{max(tps_values):.1f}"
+                "scaling_ratio": round(float(scaling_ratio), 2),
+                "vu_range": f"{int(vus.min())}-{int(vus.max())}",
+                "tps_range": f"{tps_values.min():.1f}-{tps_values.max():.1f}"
             }
 
         except Exception as e:
@@ -454,10 +584,11 @@ class TimeseriesDataProcessor:
             return {"correlation": "calculation_error", "coefficient": 0.0, "pattern": "unknown"}
 
 
+# 상태를 변경하지 않는 클래스이므로 모듈 로드 시 한 번만 생성
+_TIMESERIES_DATA_PROCESSOR = TimeseriesDataProcessor()
+
+
 def get_timeseries_data_processor() -> TimeseriesDataProcessor:
     """TimeseriesDataProcessor 인스턴스 반환 (싱글톤)"""
 
-    if not hasattr(get_timeseries_data_processor, "_instance"):
-        get_timeseries_data_processor._instance = TimeseriesDataProcessor()
-
-    return get_timeseries_data_processor._instance
\ No newline at end of file
+    return _TIMESERIES_DATA_PROCESSOR
\ No newline at end of file
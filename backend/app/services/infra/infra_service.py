@@ -1,51 +1,84 @@
+import asyncio
 import logging
 from typing import Dict, Any
 
 from kubernetes.client import V1Deployment
-from sqlalchemy import select
+from sqlalchemy import exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, contains_eager
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy.orm.attributes import flag_modified
 
 from app.common.exception.api_exception import ApiException
 from app.common.response.code import FailureCode
+from app.dependencies import get_resource_service, get_pod_service, get_service_service, get_deploy_service
 from app.models.sqlite.models import ServerInfraModel, OpenAPISpecModel, OpenAPISpecVersionModel, \
     OpenAPISpecVersionDetailModel
 from app.schemas.infra import ConnectOpenAPIInfraRequest, UpdateServerInfraResourceUsageRequest
 from app.schemas.openapi_spec.plog_deploy_request import PlogConfigDTO
 from app.services.openapi.openapi_service import convertOpenAPISpecModelToDto, process_helm_chart
-from k8s.deploy_service import DeployService
-from k8s.pod_service import PodService
-from k8s.resource_service import ResourceService
-from k8s.service_service import ServiceService
 
 logger = logging.getLogger(__name__)
 
+# UpdateServerInfraResourceUsageRequest 필드 -> resources[section][key] 매핑
+_RESOURCE_FIELDS = (
+    ("cpu_request_millicores", "requests", "cpu"),
+    ("memory_request_millicores", "requests", "memory"),
+    ("cpu_limit_millicores", "limits", "cpu"),
+    ("memory_limit_millicores", "limits", "memory"),
+)
+
 async def build_response_get_pods_info_list(
         db: AsyncSession
 ):
-    resource_service = ResourceService()
-    pod_service = PodService()
-    service_service = ServiceService()
-
+    resource_service = get_resource_service()
+    pod_service = get_pod_service()
 
     responses = []
-    stmt = select(ServerInfraModel)
+    # 응답에 필요한 컬럼만 조회하여 ORM 인스턴스 생성 없이 Row로 사용 (읽기 전용)
+    stmt = select(
+        ServerInfraModel.id,
+        ServerInfraModel.openapi_spec_id,
+        ServerInfraModel.name,
+        ServerInfraModel.resource_type,
+        ServerInfraModel.service_type,
+        ServerInfraModel.group_name,
+        ServerInfraModel.label,
+        ServerInfraModel.namespace,
+    )
     result = await db.execute(stmt)
-    server_infras = result.scalars().all()
-
+    server_infras = result.all()
+
+    # server_infra마다 Kubernetes API를 호출하지 않고 목록을 한 번씩 조회하여 매칭
+    # (동기 kubernetes client 호출은 스레드에서 실행하고, 서로 독립적인 조회는 동시에 수행)
+    # Pod 목록은 한 번만 조회하여 상세 정보와 리소스 집계에 함께 사용
+    pod_names = [server_infra.name for server_infra in server_infras]
+    pods = await asyncio.to_thread(pod_service.list_pods)
+    pod_info_by_pod = await asyncio.to_thread(pod_service.get_pods_details_with_owner_info, pod_names, pods)
+    pod_labels_by_name = {
+        pod_name: pod_info["labels"]
+        for pod_name, pod_info in pod_info_by_pod.items()
+        if pod_info
+    }
+    # 리소스 집계는 실제로 존재하는 Pod에 대해서만 수행 (API 호출 없이 조회한 Pod 목록에서 계산)
+    resource_specs_by_pod = resource_service.get_multiple_pods_resources(list(pod_labels_by_name), pods)
+    services_by_pod, workloads_by_pod = await asyncio.gather(
+        asyncio.to_thread(pod_service.find_services_for_pods, pod_labels_by_name),
+        asyncio.to_thread(pod_service.find_workloads_for_pods, pod_labels_by_name),
+    )
 
     for server_infra in server_infras:
         pod_name = server_infra.name
-        resource_specs = resource_service.get_pod_aggregated_resources(pod_name)
-        pod_info = pod_service.get_pod_details_with_owner_info(pod_name)
+        pod_info = pod_info_by_pod.get(pod_name)
 
         if not pod_info:
             continue
 
         # 하나의 배포 단위 당 하나의 service가 존재한다고 가정
-        services = pod_service.find_services_for_pod(pod_info["labels"])
-        workloads = pod_service.find_workloads_for_pod(pod_info["labels"])
+        services = services_by_pod.get(pod_name, [])
+        if not services:
+            continue
+
+        workloads = workloads_by_pod.get(pod_name, [])
         workload = workloads[0]
         replica = None
 
@@ -54,9 +87,7 @@ async def build_response_get_pods_info_list(
         else:
             replica = workload.get("current_replicas", 1)
 
-        if not services:
-            continue
-
+        resource_specs = resource_specs_by_pod.get(pod_name)
         service = services[0]
         response = {
             "server_infra_id": server_infra.id,
@@ -83,22 +114,32 @@ async def update_connection_openapi_spec_and_server_infra(
         db: AsyncSession,
         request: ConnectOpenAPIInfraRequest
 ):
-    stmt = select(ServerInfraModel).where(ServerInfraModel.group_name == request.group_name)
+    # OpenAPI spec이 존재할 때만 그룹 내 모든 server_infra를 단일 UPDATE 문으로 갱신
+    openapi_spec_exists = (
+        select(OpenAPISpecModel.id)
+        .where(OpenAPISpecModel.id == request.openapi_spec_id)
+        .exists()
+    )
+    stmt = (
+        update(ServerInfraModel)
+        .where(ServerInfraModel.group_name == request.group_name, openapi_spec_exists)
+        .values(openapi_spec_id=request.openapi_spec_id)
+        .execution_options(synchronize_session=False)
+    )
     result = await db.execute(stmt)
-    server_infras = result.scalars().all()
-
-
-    if not server_infras:
-        raise ApiException(FailureCode.NOT_FOUND_DATA, "Not Found Server Infra")
 
-    stmt = select(OpenAPISpecModel).where(OpenAPISpecModel.id == request.openapi_spec_id)
-    openapi_spec = await db.scalar(stmt)
-
-    if not openapi_spec:
-        raise ApiException(FailureCode.NOT_FOUND_DATA, "Not Found OpenAPI Spec")
+    if result.rowcount == 0:
+        # 갱신된 행이 없을 때만 server_infra 그룹과 OpenAPI spec 존재 여부를 한 번의 조회로 확인
+        stmt = select(
+            exists().where(ServerInfraModel.group_name == request.group_name).label("has_infra"),
+            openapi_spec_exists.label("has_spec"),
+        )
+        row = (await db.execute(stmt)).one()
 
-    for server_infra in server_infras:
-        server_infra.openapi_spec_id = request.openapi_spec_id
+        if not row.has_infra:
+            raise ApiException(FailureCode.NOT_FOUND_DATA, "Not Found Server Infra")
+        if not row.has_spec:
+            raise ApiException(FailureCode.NOT_FOUND_DATA, "Not Found OpenAPI Spec")
 
     await db.commit()
 
@@ -106,40 +147,40 @@ async def process_updated_server_infra_resource_usage(
         db: AsyncSession,
         request: UpdateServerInfraResourceUsageRequest
 ):
-    deploy_service = DeployService()
-    resource_service = ResourceService()
-    logger.info(f"Request recived {request.model_dump()}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Request received {request.model_dump()}")
 
     # 현재 배포되어 있는 resource info 조회
+    # 활성 버전 존재 여부는 EXISTS 서브쿼리로 필터링하여 JOIN으로 행이 늘어나지 않게 하고,
+    # 연관 객체는 selectinload로 별도 IN 조회 (openapi_spec_versions는 활성 버전만 로드하므로 [0]이 활성 버전)
+    has_active_version = ServerInfraModel.openapi_spec.has(
+        OpenAPISpecModel.openapi_spec_versions.any(OpenAPISpecVersionModel.is_activate == True)
+    )
     stmt = (
         select(ServerInfraModel)
-        .join(ServerInfraModel.openapi_spec)
-        .join(OpenAPISpecModel.openapi_spec_versions)
-        .outerjoin(OpenAPISpecVersionModel.version_detail)
-        .filter(OpenAPISpecVersionModel.is_activate == True)
+        .where(has_active_version)
         .options(
-            contains_eager(ServerInfraModel.openapi_spec)
-            .contains_eager(OpenAPISpecModel.openapi_spec_versions)
-            .contains_eager(OpenAPISpecVersionModel.version_detail)
+            selectinload(ServerInfraModel.openapi_spec)
+            .selectinload(OpenAPISpecModel.openapi_spec_versions.and_(OpenAPISpecVersionModel.is_activate == True))
+            .selectinload(OpenAPISpecVersionModel.version_detail)
         )
         .where(ServerInfraModel.group_name == request.group_name)
+        .limit(1)
     )
 
-    result = await db.execute(stmt)
-    server_infras = result.scalars()
-
-    first_server_infra = server_infras.first()
-    logger.info(f"first_server_infra: {first_server_infra}")
+    # limit(1) + selectinload이므로 중복 행이 없어 unique() 없이 단일 객체로 조회
+    first_server_infra = (await db.execute(stmt)).scalar_one_or_none()
+    logger.debug(f"first_server_infra: {first_server_infra}")
 
     if not first_server_infra:
-        # JOIN 쿼리 실패시 단순 조회로 fallback
-        logger.warning(f"JOIN query failed for group_name: {request.group_name}, trying simple query")
-        simple_stmt = select(ServerInfraModel).where(ServerInfraModel.group_name == request.group_name)
-        simple_result = await db.execute(simple_stmt)
-        simple_infras = simple_result.scalars().all()
-        logger.info(f"Simple query result count: {len(simple_infras)}")
-        if simple_infras:
-            logger.info(f"Simple query first item openapi_spec_id: {simple_infras[0].openapi_spec_id}")
+        logger.warning(f"No server infra with active OpenAPI spec for group_name: {request.group_name}")
+        # 원인 파악용 단순 조회는 DEBUG 로그가 켜진 경우에만 실행 (에러 경로의 추가 DB 조회 방지)
+        if logger.isEnabledFor(logging.DEBUG):
+            simple_stmt = select(ServerInfraModel.openapi_spec_id).where(ServerInfraModel.group_name == request.group_name)
+            openapi_spec_ids = (await db.execute(simple_stmt)).scalars().all()
+            logger.debug(f"Simple query result count: {len(openapi_spec_ids)}")
+            if openapi_spec_ids:
+                logger.debug(f"Simple query first item openapi_spec_id: {openapi_spec_ids[0]}")
 
         raise ApiException(FailureCode.NOT_FOUND_DATA, f"Not Found Server Infra with active OpenAPI spec for group: {request.group_name}")
 
@@ -176,62 +217,64 @@ async def process_updated_server_infra_resource_usage(
     # version_detail 현재 값 조회 및 변경
     current_replicas = version_detail.replicas
     current_resource_info: Dict[str, Any] = version_detail.resources
+    # update_resource_info가 중첩 dict를 제자리 변경하므로 변경 전 값을 먼저 응답 형태로 보존
+    past_resource_usage = _build_resource_usage(current_resource_info)
     updated_resource_info = update_resource_info(current_resource_info, request)
-    logger.info(f"updated_resource_info: {updated_resource_info}")
+    current_resource_usage = _build_resource_usage(updated_resource_info)
+    logger.debug(f"updated_resource_info: {updated_resource_info}")
+
+    response = {
+        "past": {
+            "replicas": current_replicas,
+            "resource_usage": past_resource_usage,
+        },
+        "current": {
+            "replicas": request.replicas,
+            "resource_usage": current_resource_usage,
+        }
+    }
+
+    # 요청 값이 현재 값과 같으면 DB 저장과 Helm 재배포 생략
+    if past_resource_usage == current_resource_usage and request.replicas == current_replicas:
+        logger.info(f"Resource usage unchanged for {request.group_name}, skipping helm upgrade")
+        return response
 
     # helm chart request 생성 및 변경된 값 적용
     plog_config_dto:PlogConfigDTO = convertOpenAPISpecModelToDto(version_detail)
     plog_config_dto.resources = updated_resource_info
     plog_config_dto.replicas = request.replicas
-    logger.info(f"plog_config_dto: {plog_config_dto.model_dump()}")
-
-    # SQLAlchemy 변경 추적을 위한 명시적 처리
-    version_detail.resources = updated_resource_info.copy()  # 새로운 객체로 할당
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"plog_config_dto: {plog_config_dto.model_dump()}")
 
     if request.replicas >= 1:
         version_detail.replicas = request.replicas
 
-    # 또는 flag_modified 사용 (선택적)
+    # update_resource_info가 version_detail.resources의 중첩 dict를 제자리 변경하므로
+    # 복사/재할당 없이 JSON 컬럼 변경만 명시적으로 표시
     flag_modified(version_detail, 'resources')
-    await db.commit()
-
-    # 변경된 resource 값으로 배포
-    await process_helm_chart(plog_config_dto)
-
-    response = {
-        "past" : {
-            "replicas": current_replicas,
-            "resource_usage": {
-                "cpu": {
-                    "request": current_resource_info["requests"]["cpu"],
-                    "limit": current_resource_info["limits"]["cpu"],
-                },
-                "memory": {
-                    "request": current_resource_info["requests"]["memory"],
-                    "limit": current_resource_info["limits"]["memory"],
-                }
-            }
-        },
-        "current": {
-            "replicas": request.replicas,
-            "resource_usage": {
-                "cpu": {
-                    "request": updated_resource_info["requests"]["cpu"],
-                    "limit": updated_resource_info["limits"]["cpu"],
-                },
-                "memory": {
-                    "request": updated_resource_info["requests"]["memory"],
-                    "limit": updated_resource_info["limits"]["memory"],
-                }
-            }
-        }
-    }
 
+    # 변경된 resource 값으로 배포 후 성공한 경우에만 저장
+    # (배포 실패 시 DB 값이 바뀌어 있으면 같은 값으로 재시도할 때 '변경 없음'으로 건너뛰게 됨)
+    try:
+        await process_helm_chart(plog_config_dto)
+    except Exception:
+        await db.rollback()
+        raise
+    await db.commit()
 
     return response
 
 
 
+def _build_resource_usage(resource_info: Dict[str, Any]) -> Dict[str, Any]:
+    """resources 딕셔너리를 응답용 cpu/memory request/limit 구조로 변환"""
+    requests = resource_info.get("requests") or {}
+    limits = resource_info.get("limits") or {}
+    return {
+        "cpu": {"request": requests.get("cpu"), "limit": limits.get("cpu")},
+        "memory": {"request": requests.get("memory"), "limit": limits.get("memory")},
+    }
+
 def update_resource_info(
         current_resource_info: Dict[str, Any],
         update_resource_info: UpdateServerInfraResourceUsageRequest
@@ -247,25 +290,14 @@ def update_resource_info(
         Dict[str, Any]: 업데이트된 리소스 정보
     """
 
-    if update_resource_info.cpu_request_millicores is None:
-        current_resource_info["requests"]["cpu"] = "null"
-    else:
-        current_resource_info["requests"]["cpu"] = update_resource_info.cpu_request_millicores
-
-    if update_resource_info.memory_request_millicores is None:
-        current_resource_info["requests"]["memory"] = "null"
-    else:
-        current_resource_info["requests"]["memory"] = update_resource_info.memory_request_millicores
-
-    if update_resource_info.cpu_limit_millicores is None:
-        current_resource_info["limits"]["cpu"] = "null"
-    else:
-        current_resource_info["limits"]["cpu"] = update_resource_info.cpu_limit_millicores
-
-    if update_resource_info.memory_limit_millicores is None:
-        current_resource_info["limits"]["memory"] = "null"
-    else:
-        current_resource_info["limits"]["memory"] = update_resource_info.memory_limit_millicores
+    sections = {
+        "requests": current_resource_info.setdefault("requests", {}),
+        "limits": current_resource_info.setdefault("limits", {}),
+    }
+    # 값이 없으면 "null" 문자열로 설정
+    for attr, section, key in _RESOURCE_FIELDS:
+        value = getattr(update_resource_info, attr)
+        sections[section][key] = "null" if value is None else value
 
     return current_resource_info
 
@@ -287,26 +319,28 @@ async def create_and_save_version_detail(
     Returns:
         OpenAPISpecVersionDetailModel: 생성된 version detail 객체
     """
-    deploy_service = DeployService()
-    service_service = ServiceService()
+    deploy_service = get_deploy_service()
+    service_service = get_service_service()
     from app.models.sqlite.models import OpenAPISpecVersionDetailModel
 
+    # 이후 Kubernetes 조회는 앞 단계 결과에 의존하므로 순차 실행하되, 동기 client 호출은 스레드에서 실행
     # Pod에서 Deployment 이름 찾기
-    deployment_name = deploy_service.find_deployment_name_from_pod(pod_name, namespace)
+    deployment_name = await asyncio.to_thread(deploy_service.find_deployment_name_from_pod, pod_name, namespace)
 
     if not deployment_name:
         raise Exception(f"Could not find deployment for pod: {pod_name}")
 
     # Deployment 정보로부터 detail 추출
-    deployment: V1Deployment = deploy_service.get_deployment_details(deployment_name, namespace)
+    deployment: V1Deployment = await asyncio.to_thread(deploy_service.get_deployment_details, deployment_name, namespace)
     deploy_dict = deployment.to_dict()
 
-    logger.info(f"Deployment dict keys: {deploy_dict.keys()}")
-    logger.info(f"Spec keys: {deploy_dict.get('spec', {}).keys()}")
-    logger.info(f"Selector: {deploy_dict.get('spec', {}).get('selector', {})}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Deployment dict keys: {deploy_dict.keys()}")
+        logger.debug(f"Spec keys: {deploy_dict.get('spec', {}).keys()}")
+        logger.debug(f"Selector: {deploy_dict.get('spec', {}).get('selector', {})}")
 
     image_url = deploy_dict["spec"]["template"]["spec"]["containers"][0]["image"]
-    logger.info(f"Image URL: {image_url}")
+    logger.debug(f"Image URL: {image_url}")
 
     repo_part, image_tag = image_url.rsplit(":", 1)
     registry, repository = repo_part.split("/", 1)
@@ -316,9 +350,9 @@ async def create_and_save_version_detail(
     selector = deploy_dict.get("spec", {}).get("selector", {})
     labels = selector.get("match_labels") or selector.get("matchLabels", {})
 
-    logger.info(f"Extracted labels: {labels}")
+    logger.debug(f"Extracted labels: {labels}")
 
-    services = service_service.get_service_by_labels(labels)
+    services = await asyncio.to_thread(service_service.get_service_by_labels, labels)
     service = services[0]
 
     # app_name 추출 (metadata에서)
@@ -1,15 +1,22 @@
 import logging
 from typing import List, Optional, Dict, Any, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.models.sqlite.models.project_models import ServerInfraModel
+from app.models.sqlite.models.history_models import TestHistoryModel, ScenarioHistoryModel
+from app.models.sqlite.models.project_models import (
+    ServerInfraModel, EndpointModel, OpenAPISpecModel, OpenAPISpecVersionModel
+)
 from app.models.sqlite.database import SessionLocal
 
 logger = logging.getLogger(__name__)
 
+# 파라미터가 없는 조회문은 모듈 로드 시 한 번만 구성하여 재사용
+_STMT_DISTINCT_GROUP_NAMES = select(ServerInfraModel.group_name).distinct()
+_STMT_DISTINCT_SPEC_ID_GROUP_NAMES = select(ServerInfraModel.openapi_spec_id, ServerInfraModel.group_name).distinct()
+
 
 class ServerInfraService:
     """ServerInfra 테이블 관련 서비스"""
@@ -26,11 +33,9 @@ class ServerInfraService:
             저장된 Pod 이름 리스트
         """
         try:
-            existing_pods = db.query(ServerInfraModel).filter(
-                ServerInfraModel.namespace == namespace
-            ).all()
-            
-            return [pod.name for pod in existing_pods]
+            # ORM 객체를 만들지 않고 name 컬럼만 조회
+            stmt = select(ServerInfraModel.name).where(ServerInfraModel.namespace == namespace)
+            return list(db.execute(stmt).scalars())
             
         except Exception as e:
             logger.error(f"Error getting existing pod names: {e}")
@@ -49,12 +54,11 @@ class ServerInfraService:
             해당 그룹의 저장된 Pod 이름 리스트
         """
         try:
-            existing_pods = db.query(ServerInfraModel).filter(
+            stmt = select(ServerInfraModel.name).where(
                 ServerInfraModel.group_name == group_name,
                 ServerInfraModel.namespace == namespace
-            ).all()
-            
-            return [pod.name for pod in existing_pods]
+            )
+            return list(db.execute(stmt).scalars())
             
         except Exception as e:
             logger.error(f"Error getting existing pod names for group {group_name}: {e}")
@@ -75,7 +79,7 @@ class ServerInfraService:
         """
         try:
             server_infra = ServerInfraModel(
-                open_api_spec_id=open_api_spec_id,
+                openapi_spec_id=open_api_spec_id,
                 resource_type=pod_info.get("resource_type"),
                 environment="K3S",  # 고정값
                 service_type=pod_info.get("service_type"),
@@ -110,24 +114,23 @@ class ServerInfraService:
             ServerInfraModel 인스턴스 또는 None
         """
         try:
-            return db.query(ServerInfraModel).filter(
+            stmt = select(ServerInfraModel).where(
                 ServerInfraModel.name == name,
                 ServerInfraModel.namespace == namespace
-            ).first()
+            ).limit(1)
+            return db.execute(stmt).scalars().first()
             
         except Exception as e:
             logger.error(f"Error getting server_infra by name {name}: {e}")
             return None
 
     def get_server_infra_exists_group_names(self, db: Session) -> List[str]:
-        stmt = select(ServerInfraModel.group_name).distinct()
-        result = db.execute(stmt).scalars().all()
+        result = db.execute(_STMT_DISTINCT_GROUP_NAMES).scalars().all()
 
         return result
 
     def get_server_infra_group_names_with_openapi_spec_id(self, db: Session)-> List[Tuple[int, str]]:
-        stmt = select(ServerInfraModel.openapi_spec_id, ServerInfraModel.group_name).distinct()
-        result = db.execute(stmt).all()
+        result = db.execute(_STMT_DISTINCT_SPEC_ID_GROUP_NAMES).all()
 
         return result
 
@@ -145,12 +148,10 @@ class ServerInfraService:
             업데이트 성공 여부
         """
         try:
-            server_infra = db.query(ServerInfraModel).filter(
-                ServerInfraModel.id == server_infra_id
-            ).first()
+            server_infra = db.get(ServerInfraModel, server_infra_id)
             
             if server_infra:
-                server_infra.open_api_spec_id = open_api_spec_id
+                server_infra.openapi_spec_id = open_api_spec_id
                 db.commit()
                 logger.info(f"Updated server_infra {server_infra_id} with openapi_spec {open_api_spec_id}")
                 return True
@@ -175,17 +176,53 @@ class ServerInfraService:
             연결되지 않은 서버 Pod 리스트
         """
         try:
-            return db.query(ServerInfraModel).filter(
+            stmt = select(ServerInfraModel).where(
                 ServerInfraModel.namespace == namespace,
                 ServerInfraModel.service_type == "SERVER",
-                ServerInfraModel.open_api_spec_id.is_(None)
-            ).all()
+                ServerInfraModel.openapi_spec_id.is_(None)
+            )
+            return list(db.execute(stmt).scalars().all())
             
         except Exception as e:
             logger.error(f"Error getting unlinked server pods: {e}")
             return []
 
 
+def _build_job_pods_stmt(job_name: str):
+    """
+    job_name → TestHistory → ScenarioHistory → Endpoint → OpenAPISpecVersion → OpenAPISpec → ServerInfra
+    경로를 하나의 JOIN 쿼리로 만들어 (Pod 이름, service_type)만 조회
+
+    같은 (이름, service_type) 조합은 한 번만 반환하며, 시나리오 순서상 처음 등장한 순서로 정렬합니다.
+    service_type이 없으면 SQL에서 기본값 SERVER로 채웁니다.
+    """
+    service_type = func.coalesce(ServerInfraModel.service_type, "SERVER").label("service_type")
+
+    return (
+        select(ServerInfraModel.name, service_type)
+        .select_from(TestHistoryModel)
+        .join(TestHistoryModel.scenarios)
+        .join(ScenarioHistoryModel.endpoint)
+        .join(EndpointModel.openapi_spec_version)
+        .join(OpenAPISpecVersionModel.openapi_spec)
+        .join(OpenAPISpecModel.server_infras)
+        .where(TestHistoryModel.job_name == job_name, ServerInfraModel.name.is_not(None))
+        .group_by(ServerInfraModel.name, service_type)
+        .order_by(func.min(ScenarioHistoryModel.id), func.min(ServerInfraModel.id))
+    )
+
+
+def _to_pod_info_list(rows) -> List[Dict[str, str]]:
+    """(Pod 이름, service_type) 행을 Pod 정보 리스트로 변환 (Pod 이름 기준 중복 제거)"""
+    # Pod 이름을 키로 하는 dict 하나로 중복 제거와 순서 유지를 함께 처리
+    pods: Dict[str, Dict[str, str]] = {}
+
+    for pod_name, service_type in rows:
+        pods.setdefault(pod_name, {"pod_name": pod_name, "service_type": service_type})
+
+    return list(pods.values())
+
+
 def get_job_pods_with_service_types(job_name: str) -> List[Dict[str, str]]:
     """
     Job 이름으로 관련 Pod 목록과 service_type 조회
@@ -198,49 +235,12 @@ def get_job_pods_with_service_types(job_name: str) -> List[Dict[str, str]]:
     Returns:
         List[Dict]: [{"pod_name": "api-server-123", "service_type": "SERVER"}, ...]
     """
-    # 순환참조 방지를 위해 지연 import
-    from app.services.testing.test_history_service import get_test_history_by_job_name
-    
     db = SessionLocal()
     try:
-        # 1. job_name으로 TestHistory 조회
-        test_history = get_test_history_by_job_name(db, job_name)
-        if not test_history:
-            logger.warning(f"No test history found for job: {job_name}")
-            return []
-        
-        pod_info_list = []
-        processed_pods = set()  # 중복 제거용
-        
-        # 2. TestHistory의 scenario들에서 각각의 server_infra 정보 추출
-        for scenario in test_history.scenarios:
-            try:
-                endpoint = scenario.endpoint
-                if not endpoint or not endpoint.openapi_spec_version:
-                    logger.debug(f"Skipping scenario {scenario.id} - missing endpoint or spec version")
-                    continue
-                
-                openapi_spec = endpoint.openapi_spec_version.openapi_spec
-                if not openapi_spec or not openapi_spec.server_infras:
-                    logger.debug(f"Skipping scenario {scenario.id} - missing openapi spec or server infras")
-                    continue
-                
-                # 3. 각 server_infra에서 Pod 정보 추출
-                for server_infra in openapi_spec.server_infras:
-                    if server_infra.name and server_infra.name not in processed_pods:
-                        pod_info = {
-                            "pod_name": server_infra.name,
-                            "service_type": server_infra.service_type or "SERVER"  # 기본값 SERVER
-                        }
-                        pod_info_list.append(pod_info)
-                        processed_pods.add(server_infra.name)
-                        
-                        logger.debug(f"Found pod: {server_infra.name} (type: {server_infra.service_type})")
-                
-            except Exception as e:
-                logger.error(f"Error processing scenario {scenario.id}: {e}")
-                continue
-        
+        # ORM 객체 그래프를 로드하지 않고 필요한 두 컬럼만 한 번의 JOIN 쿼리로 조회
+        rows = db.execute(_build_job_pods_stmt(job_name)).all()
+        pod_info_list = _to_pod_info_list(rows)
+
         logger.info(f"Found {len(pod_info_list)} pods for job {job_name}: "
                    f"{[p['pod_name'] for p in pod_info_list]}")
         
@@ -269,48 +269,11 @@ async def get_job_pods_with_service_types_async(
     Returns:
         List[Dict]: [{"pod_name": "api-server-123", "service_type": "SERVER"}, ...]
     """
-    # 순환참조 방지를 위해 지연 import
-    from app.services.testing.test_history_service import get_test_history_by_job_name_async
-    
     try:
-        # 1. job_name으로 TestHistory 조회
-        test_history = await get_test_history_by_job_name_async(db, job_name)
-        if not test_history:
-            logger.warning(f"No test history found for job: {job_name}")
-            return []
-        
-        pod_info_list = []
-        processed_pods = set()  # 중복 제거용
-        
-        # 2. TestHistory의 scenario들에서 각각의 server_infra 정보 추출
-        for scenario in test_history.scenarios:
-            try:
-                endpoint = scenario.endpoint
-                if not endpoint or not endpoint.openapi_spec_version:
-                    logger.debug(f"Skipping scenario {scenario.id} - missing endpoint or spec version")
-                    continue
-                
-                openapi_spec = endpoint.openapi_spec_version.openapi_spec
-                if not openapi_spec or not openapi_spec.server_infras:
-                    logger.debug(f"Skipping scenario {scenario.id} - missing openapi spec or server infras")
-                    continue
-                
-                # 3. 각 server_infra에서 Pod 정보 추출
-                for server_infra in openapi_spec.server_infras:
-                    if server_infra.name and server_infra.name not in processed_pods:
-                        pod_info = {
-                            "pod_name": server_infra.name,
-                            "service_type": server_infra.service_type or "SERVER"  # 기본값 SERVER
-                        }
-                        pod_info_list.append(pod_info)
-                        processed_pods.add(server_infra.name)
-                        
-                        logger.debug(f"Found pod: {server_infra.name} (type: {server_infra.service_type})")
-                
-            except Exception as e:
-                logger.error(f"Error processing scenario {scenario.id}: {e}")
-                continue
-        
+        # ORM 객체 그래프를 로드하지 않고 필요한 두 컬럼만 한 번의 JOIN 쿼리로 조회
+        rows = (await db.execute(_build_job_pods_stmt(job_name))).all()
+        pod_info_list = _to_pod_info_list(rows)
+
         logger.info(f"Found {len(pod_info_list)} pods for job {job_name}: "
                    f"{[p['pod_name'] for p in pod_info_list]}")
         
@@ -318,4 +281,4 @@ async def get_job_pods_with_service_types_async(
         
     except Exception as e:
         logger.error(f"Error getting pods for job {job_name}: {e}")
-        return []
\ No newline at end of file
+        return []
@@ -1,165 +1,475 @@
 import logging
-from typing import Dict, Optional, List, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 from influxdb import InfluxDBClient
+from influxdb.resultset import ResultSet
 from app.core.config import settings
-from datetime import datetime, timedelta
-import pytz
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+import numpy as np
 from app.sse.metrics_buffer import SmartMetricsBuffer
 
 logger = logging.getLogger(__name__)
 
 
+# 메트릭 요약 쿼리 템플릿 - 식별자는 문자열 보간 대신 bind_params($변수)로 전달
+# 5초 단위 요청 수 - 총 요청 수와 min/max/avg TPS를 이 결과 하나로 계산
+_REQUESTS_PER_WINDOW_QUERY = (
+    'SELECT SUM("value") AS requests FROM "http_reqs" WHERE {filter} GROUP BY time(5s) fill(none)'
+)
+# 실패 요청 판정은 정규식 대신 k6 expected_response 태그의 동등 비교로 수행
+# (생성 스크립트의 setResponseCallback으로 2xx만 expected 처리 - load_test_service 참고)
+_FAILED_REQUESTS_QUERY = (
+    'SELECT SUM("value") AS failed_requests FROM "http_reqs" WHERE {filter} AND "expected_response" = \'false\''
+)
+_RESPONSE_TIME_QUERY = (
+    'SELECT MEAN("value") AS avg_response_time, MAX("value") AS max_response_time, '
+    'MIN("value") AS min_response_time, PERCENTILE("value", 50) AS p50_response_time, '
+    'PERCENTILE("value", 95) AS p95_response_time, PERCENTILE("value", 99) AS p99_response_time '
+    'FROM "http_req_duration" WHERE {filter}'
+)
+# 5초 단위 에러율 - 서브쿼리 없이 버킷 값만 조회하고 min/max/avg는 클라이언트에서 계산
+_ERROR_RATE_QUERY = (
+    'SELECT MEAN("value") AS err FROM "http_req_failed" WHERE {filter} GROUP BY time(5s) fill(none)'
+)
+_VUS_QUERY = (
+    'SELECT MAX("value") AS max_vus, MIN("value") AS min_vus, MEAN("value") AS avg_vus '
+    'FROM "vus" WHERE {filter}'
+)
+# 단일 selector는 해당 포인트의 timestamp를 반환하므로 전체 행 정렬 없이 시작/종료 시간 조회
+_START_TIME_QUERY = 'SELECT FIRST("value") FROM "http_reqs" WHERE {filter}'
+_END_TIME_QUERY = 'SELECT LAST("value") FROM "http_reqs" WHERE {filter}'
+
+_JOB_FILTER = '"job_name" = $job_name'
+_SCENARIO_FILTER = '"scenario" = $scenario'
+
+_OVERALL_METRICS_QUERIES: Tuple[str, ...] = tuple(
+    query.format(filter=_JOB_FILTER) for query in (
+        _REQUESTS_PER_WINDOW_QUERY, _FAILED_REQUESTS_QUERY, _RESPONSE_TIME_QUERY,
+        _ERROR_RATE_QUERY, _VUS_QUERY, _START_TIME_QUERY, _END_TIME_QUERY
+    )
+)
+_SCENARIO_METRICS_QUERIES: Tuple[str, ...] = tuple(
+    query.format(filter=_SCENARIO_FILTER) for query in (
+        _REQUESTS_PER_WINDOW_QUERY, _FAILED_REQUESTS_QUERY, _RESPONSE_TIME_QUERY,
+        _ERROR_RATE_QUERY, _START_TIME_QUERY, _END_TIME_QUERY
+    )
+)
+_TIME_RANGE_QUERIES: Tuple[str, ...] = (
+    _START_TIME_QUERY.format(filter=_JOB_FILTER),
+    _END_TIME_QUERY.format(filter=_JOB_FILTER),
+)
+_SCENARIO_NAMES_QUERY = f'SHOW TAG VALUES FROM "http_reqs" WITH KEY = "scenario" WHERE {_JOB_FILTER}'
+
+# 시계열 조회 쿼리 - job/시간 범위도 bind_params로 전달해 호출마다 동일한 쿼리 문자열 유지
+_TIMESERIES_FILTER = '"job_name" = $job_name AND time >= $start_time AND time < $end_time'
+_TIMESERIES_QUERIES: Tuple[str, ...] = tuple(
+    query.format(filter=_TIMESERIES_FILTER) for query in (
+        # 전체 TPS (나눗셈은 DB 대신 클라이언트에서 수행)
+        'SELECT SUM("value") AS requests FROM "http_reqs" WHERE {filter} '
+        'GROUP BY time(5s) fill(null) TZ(\'Asia/Seoul\')',
+        # 전체 VUS (별도 measurement)
+        'SELECT LAST("value") AS vus FROM "vus" WHERE {filter} '
+        'GROUP BY time(5s) fill(null) TZ(\'Asia/Seoul\')',
+        # 전체 에러율 - expected_response 태그별 요청 수를 한 번에 조회하여 에러/전체 요청 수를 함께 계산
+        'SELECT SUM("value") AS requests FROM "http_reqs" WHERE {filter} '
+        'GROUP BY time(5s), "expected_response" fill(none) TZ(\'Asia/Seoul\')',
+        # 전체 응답시간
+        'SELECT MEAN("value") AS avg_response_time, PERCENTILE("value", 95) AS p95_response_time, '
+        'PERCENTILE("value", 99) AS p99_response_time FROM "http_req_duration" WHERE {filter} '
+        'GROUP BY time(5s) fill(null) TZ(\'Asia/Seoul\')',
+        # 시나리오별 TPS 및 VUS - 시나리오마다 따로 조회하지 않고 scenario 태그로 묶어 한 번에 집계
+        'SELECT SUM("value") AS requests, LAST("value") AS vus FROM "http_reqs" WHERE {filter} '
+        'GROUP BY time(5s), "scenario" fill(null) TZ(\'Asia/Seoul\')',
+        # 시나리오별 에러율 - scenario/expected_response 태그별 요청 수
+        'SELECT SUM("value") AS requests FROM "http_reqs" WHERE {filter} '
+        'GROUP BY time(5s), "scenario", "expected_response" fill(none) TZ(\'Asia/Seoul\')',
+        # 시나리오별 응답시간
+        'SELECT MEAN("value") AS avg_response_time, PERCENTILE("value", 95) AS p95_response_time, '
+        'PERCENTILE("value", 99) AS p99_response_time FROM "http_req_duration" WHERE {filter} '
+        'GROUP BY time(5s), "scenario" fill(null) TZ(\'Asia/Seoul\')',
+    )
+)
+
+# Pod 리소스 사용량 쿼리 (5초 단위)
+_POD_RESOURCE_FILTER = (
+    '"pod" = $pod_name AND "container" = \'\' AND "image" = \'\' '
+    'AND time >= $start_time AND time < $end_time'
+)
+# CPU 사용량 (millicores 단위) mean vs last
+_CPU_METRICS_QUERY = (
+    'SELECT non_negative_derivative(mean("container_cpu_usage_seconds_total"), 1s) * 1000 AS cpu_millicores '
+    f'FROM "cadvisor_metrics" WHERE {_POD_RESOURCE_FILTER} '
+    'GROUP BY time(5s) fill(linear) TZ(\'Asia/Seoul\')'
+)
+# Memory 사용량 (MB 단위)
+_MEMORY_METRICS_QUERY = (
+    'SELECT mean("container_memory_working_set_bytes") / 1024 / 1024 AS memory_mb '
+    f'FROM "cadvisor_metrics" WHERE {_POD_RESOURCE_FILTER} '
+    'GROUP BY time(5s) fill(linear) TZ(\'Asia/Seoul\')'
+)
+
+# 조회 결과 timestamp를 변환할 한국 표준시 (호출마다 생성하지 않도록 모듈 단위로 보관)
+KST = ZoneInfo('Asia/Seoul')
+
+# epoch='ns'로 조회한 정수 timestamp를 datetime으로 변환할 때의 기준 시각
+_UTC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_TPS_WINDOW_SECONDS = 5
+# 시나리오 시계열 TPS 환산 값 - 기존 SUM("value") / 10 쿼리와 동일한 값을 유지
+_SCENARIO_TPS_DIVISOR = 10
+
+
+def _summarize_request_windows(points: List[Dict]) -> Tuple[int, float, float, float]:
+    """
+    5초 단위 요청 수 집계 결과로 총 요청 수와 TPS 통계 계산
+
+    Returns:
+        (총 요청 수, 최대 TPS, 최소 TPS, 평균 TPS)
+    """
+    window_requests = np.fromiter(
+        (point['requests'] for point in points if point.get('requests') is not None),
+        dtype=np.float64
+    )
+    if window_requests.size == 0:
+        return 0, 0.0, 0.0, 0.0
+
+    tps = window_requests / _TPS_WINDOW_SECONDS
+    return int(window_requests.sum()), float(tps.max()), float(tps.min()), float(tps.mean())
+
+
+def _summarize_error_windows(points: List[Dict]) -> Tuple[float, float, float]:
+    """
+    5초 단위 에러율 집계 결과로 에러율 통계 계산
+
+    Returns:
+        (최대 에러율, 최소 에러율, 평균 에러율)
+    """
+    window_errors = np.fromiter(
+        (point['err'] for point in points if point.get('err') is not None),
+        dtype=np.float64
+    )
+    if window_errors.size == 0:
+        return 0.0, 0.0, 0.0
+
+    return float(window_errors.max()), float(window_errors.min()), float(window_errors.mean())
+
+
+# 응답시간 집계 결과 필드 (_RESPONSE_TIME_QUERY의 컬럼 순서)
+_RESPONSE_TIME_FIELDS = (
+    'avg_response_time', 'max_response_time', 'min_response_time',
+    'p50_response_time', 'p95_response_time', 'p99_response_time',
+)
+_get_response_time_fields = itemgetter(*_RESPONSE_TIME_FIELDS)
+_EMPTY_RESPONSE_TIMES = dict.fromkeys(_RESPONSE_TIME_FIELDS, 0)
+
+
+def _summarize_response_times(points: List[Dict]) -> List[float]:
+    """
+    응답시간 집계 결과에서 6개 필드를 한 번에 꺼내 소수점 둘째 자리로 반올림
+
+    Returns:
+        [평균, 최대, 최소, p50, p95, p99] 응답시간 (ms, 값이 없으면 0.0)
+    """
+    response_data = points[0] if points else _EMPTY_RESPONSE_TIMES
+    values = np.array(_get_response_time_fields(response_data), dtype=np.float64)  # None -> nan
+    return np.round(np.nan_to_num(values), 2).tolist()
+
+
+def _split_requests_by_status(series) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """
+    "expected_response" 태그별 5초 단위 요청 수 집계 결과를 버킷별 전체/에러 요청 수로 분리
+
+    에러 요청과 전체 요청을 각각 쿼리하지 않고 한 번의 스캔 결과에서 함께 계산합니다.
+
+    Args:
+        series: ResultSet.items() 형식의 ((measurement, tags), points) 시리즈 목록 (epoch='s' 조회 결과)
+
+    Returns:
+        (버킷 epoch 초별 에러 요청 수, 버킷 epoch 초별 전체 요청 수)
+    """
+    error_requests: Dict[int, float] = {}
+    total_requests: Dict[int, float] = {}
+
+    for (_, tags), points in series:
+        is_error = (tags or {}).get('expected_response') == 'false'
+        for point in points:
+            requests = point.get('requests')
+            if requests is None:
+                continue
+            bucket = point['time']
+            total_requests[bucket] = total_requests.get(bucket, 0) + requests
+            if is_error:
+                error_requests[bucket] = error_requests.get(bucket, 0) + requests
+
+    return (
+        {bucket: int(count) for bucket, count in error_requests.items()},
+        {bucket: int(count) for bucket, count in total_requests.items()},
+    )
+
+
+def _build_timeseries_entries(
+    scenario_name: Optional[str],
+    request_points: List[Dict],
+    tps_divisor: int,
+    vus_by_bucket: Dict[int, float],
+    status_series,
+    response_points: List[Dict],
+    tz
+) -> List[Dict]:
+    """
+    5초 단위 요청 수 포인트를 기준으로 VUS/에러율/응답시간을 합쳐 시계열 데이터 구성
+
+    모든 쿼리가 같은 GROUP BY time(5s) 버킷을 쓰므로 epoch 초(int)를 그대로 키로 맞추고,
+    datetime 변환은 결과 버킷마다 한 번만 수행합니다.
+
+    Args:
+        scenario_name: 시나리오 이름 (None이면 전체)
+        request_points: 요청 수 포인트 (시간순)
+        tps_divisor: 요청 수를 TPS로 환산할 때 나눌 값
+        vus_by_bucket: 버킷 epoch 초별 VUS
+        status_series: expected_response 태그별 요청 수 시리즈
+        response_points: 응답시간 포인트
+        tz: 변환할 타임존
+
+    Returns:
+        시계열 데이터 리스트 (시간순)
+    """
+    error_requests_by_bucket, total_requests_by_bucket = _split_requests_by_status(status_series)
+    response_by_bucket = {
+        point['time']: point for point in response_points if point.get('avg_response_time') is not None
+    }
+
+    entries = []
+    for point in request_points:
+        requests = point.get('requests')
+        if requests is None:
+            continue
+
+        bucket = point['time']
+        total_requests = total_requests_by_bucket.get(bucket, 0)
+        error_rate = (error_requests_by_bucket.get(bucket, 0) / total_requests * 100) if total_requests > 0 else 0.0
+        response = response_by_bucket.get(bucket)
+        entries.append({
+            'timestamp': datetime.fromtimestamp(bucket, tz=tz),
+            'scenario_name': scenario_name,
+            'tps': round(requests / tps_divisor, 1),
+            'vus': int(vus_by_bucket.get(bucket, 0)),
+            'error_rate': round(error_rate, 2),
+            'avg_response_time': round(float(response['avg_response_time']), 2) if response else 0.0,
+            'p95_response_time': round(float(response.get('p95_response_time', 0)), 2) if response else 0.0,
+            'p99_response_time': round(float(response.get('p99_response_time', 0)), 2) if response else 0.0,
+        })
+    return entries
+
+
+class MetricsResultCache:
+    """
+    InfluxDB 메트릭 조회 결과 캐시
+
+    완료된 테스트의 메트릭은 더 이상 변하지 않으므로 만료 없이 보관하고,
+    진행 중인 테스트의 결과는 짧은 TTL 동안만 재사용합니다.
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        """
+        Args:
+            maxsize: 최대 캐시 항목 수
+            ttl: 진행 중인 테스트 결과의 Time To Live (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[Any]:
+        """캐시된 값 반환, 없거나 만료되었으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple[str, str], value: Any, completed: bool = False) -> None:
+        """값 저장 (completed=True면 만료 없이 보관)"""
+        expires_at = None if completed else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, identifier: str) -> None:
+        """특정 job/시나리오 식별자의 캐시 항목 제거"""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == identifier]:
+                del self._entries[key]
+
+
+# InfluxDBService는 호출부마다 새로 생성되므로 캐시는 모듈 단위로 공유
+_METRICS_CACHE = MetricsResultCache()
+
+# 서로 독립적인 InfluxDB 조회를 동시에 보내기 위한 스레드 풀
+_QUERY_WORKERS = 8
+_QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=_QUERY_WORKERS, thread_name_prefix="influxdb-query")
+
+# 연결 풀 크기 - 스레드 풀 동시 조회에 API 요청/스케줄러 스레드의 조회까지 겹쳐도
+# 연결을 새로 맺거나 버리지 않도록 스레드 풀 크기의 두 배로 설정
+_CLIENT_POOL_SIZE = _QUERY_WORKERS * 2
+
+
+@lru_cache()
+def _get_shared_client() -> InfluxDBClient:
+    """프로세스 전체에서 공유하는 InfluxDBClient (requests.Session keep-alive 연결 재사용)"""
+    return InfluxDBClient(
+        host=settings.INFLUXDB_HOST,
+        port=settings.INFLUXDB_PORT,
+        database=settings.INFLUXDB_DATABASE,
+        # 대용량 JSON 응답 압축
+        gzip=True,
+        pool_size=_CLIENT_POOL_SIZE,
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class OverallMetrics:
+    """전체 테스트 메트릭 요약 (불변 객체라 캐시에서 복사 없이 그대로 반환)"""
+    total_requests: int             # 총 요청 수
+    failed_requests: int            # 실패한 요청 수
+    actual_tps: float               # 실제 계산된 TPS (total_requests/duration)
+    max_tps: float                  # 최대 TPS (5초 단위 집계)
+    min_tps: float                  # 최소 TPS (5초 단위 집계)
+    avg_tps: float                  # 평균 TPS (5초 단위 집계)
+    avg_response_time: float        # 평균 응답 시간 (ms)
+    max_response_time: float        # 최대 응답 시간 (ms)
+    min_response_time: float        # 최소 응답 시간 (ms)
+    p50_response_time: float        # 50번째 백분위수 응답 시간 (ms)
+    p95_response_time: float        # 95번째 백분위수 응답 시간 (ms)
+    p99_response_time: float        # 99번째 백분위수 응답 시간 (ms)
+    max_error_rate: float           # 최대 에러율 (%)
+    min_error_rate: float           # 최소 에러율 (%)
+    avg_error_rate: float           # 평균 에러율 (%)
+    max_vus: int                    # 최대 가상 사용자 수
+    min_vus: int                    # 최소 가상 사용자 수
+    avg_vus: float                  # 평균 가상 사용자 수
+    test_duration: float            # 테스트 지속 시간 (seconds)
+
+
 class InfluxDBService:
     """InfluxDB 메트릭 조회 서비스"""
     
     def __init__(self):
-        self.client = InfluxDBClient(
-            host=settings.INFLUXDB_HOST,
-            port=settings.INFLUXDB_PORT,
-            database=settings.INFLUXDB_DATABASE,
-        )
+        # 서비스를 여러 번 생성해도 연결 풀은 하나만 사용
+        self.client = _get_shared_client()
+
+    def _query_results_batch(
+        self,
+        queries: Sequence[str],
+        bind_params: Optional[Dict[str, Any]] = None,
+        epoch: Optional[str] = None
+    ) -> List[ResultSet]:
+        """
+        여러 InfluxQL 문을 세미콜론으로 묶어 한 번의 HTTP 요청으로 실행
+
+        Args:
+            queries: 실행할 쿼리 리스트
+            bind_params: 쿼리의 $변수에 바인딩할 값
+            epoch: timestamp 정밀도 ('ns' 등 지정 시 RFC3339 문자열 대신 정수 epoch 반환)
+
+        Returns:
+            쿼리 순서대로 정렬된 ResultSet 리스트 (GROUP BY 태그별 시리즈 유지)
+        """
+        combined_query = ';'.join(queries)
+        results = self.client.query(combined_query, bind_params=bind_params, epoch=epoch)
+
+        # 구문이 하나면 InfluxDBClient가 ResultSet 단건을 반환
+        if not isinstance(results, list):
+            results = [results]
+
+        if len(results) != len(queries):
+            raise ValueError(f"Expected {len(queries)} result sets, got {len(results)}")
+
+        return results
+
+    def _query_points_batch(
+        self,
+        queries: Sequence[str],
+        bind_params: Optional[Dict[str, Any]] = None,
+        epoch: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        _query_results_batch 결과를 쿼리별 포인트 리스트로 변환
+
+        Returns:
+            쿼리 순서대로 정렬된 포인트 리스트의 리스트
+        """
+        results = self._query_results_batch(queries, bind_params=bind_params, epoch=epoch)
+        return [list(result.get_points()) for result in results]
     
-    def get_overall_metrics(self, job_name: str) -> Optional[Dict]:
+    def get_overall_metrics(self, job_name: str, completed: bool = False) -> Optional[OverallMetrics]:
         """
         전체 테스트 메트릭 조회 - 모든 메트릭 통계 정보 포함
         
         Args:
             job_name: Kubernetes Job 이름
+            completed: 완료된 테스트 여부 (True면 결과를 만료 없이 캐싱)
             
         Returns:
-            전체 테스트 메트릭 딕셔너리 또는 None
-            {
-                'total_requests': int,           # 총 요청 수
-                'failed_requests': int,          # 실패한 요청 수
-                'actual_tps': float,             # 실제 계산된 TPS (total_requests/duration)
-                'max_tps': float,                # 최대 TPS (5초 단위 집계)
-                'min_tps': float,                # 최소 TPS (5초 단위 집계)
-                'avg_tps': float,                # 평균 TPS (5초 단위 집계)
-                'avg_response_time': float,      # 평균 응답 시간 (ms)
-                'max_response_time': float,      # 최대 응답 시간 (ms)
-                'min_response_time': float,      # 최소 응답 시간 (ms)
-                'p50_response_time': float,      # 50번째 백분위수 응답 시간 (ms)
-                'p95_response_time': float,      # 95번째 백분위수 응답 시간 (ms)
-                'p99_response_time': float,      # 99번째 백분위수 응답 시간 (ms)
-                'max_error_rate': float,         # 최대 에러율 (%)
-                'min_error_rate': float,         # 최소 에러율 (%)
-                'avg_error_rate': float,         # 평균 에러율 (%)
-                'max_vus': int,                  # 최대 가상 사용자 수
-                'min_vus': int,                  # 최소 가상 사용자 수
-                'avg_vus': float,                # 평균 가상 사용자 수
-                'test_duration': float           # 테스트 지속 시간 (seconds)
-            }
+            전체 테스트 메트릭(OverallMetrics) 또는 None
+            딕셔너리가 필요하면 dataclasses.asdict()로 변환
         """
+        cache_key = ('overall', job_name)
+        cached = _METRICS_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Overall metrics cache hit for job: {job_name}")
+            return cached
+
         try:
-            # HTTP 요청 수 조회
-            total_requests_query = f'''
-                SELECT SUM("value") as total_requests
-                FROM "http_reqs"
-                WHERE "job_name" = '{job_name}'
-            '''
-            
-            # 실패한 요청 수 조회  
-            failed_requests_query = f'''
-                SELECT SUM("value") as failed_requests
-                FROM "http_reqs"
-                WHERE "job_name" = '{job_name}' AND "status" !~ /^2../
-            '''
-
-            # min, max, avg tps 조회
-            tps_query = f'''
-                SELECT 
-                    MAX(tps) as max_tps,
-                    MIN(tps) as min_tps,
-                    MEAN(tps) as avg_tps
-                FROM (
-                    SELECT SUM("value")/5 as tps
-                    FROM "http_reqs"
-                    WHERE "job_name" = '{job_name}'
-                    GROUP BY time(5s) fill(none)
-                )
-            '''
-            
-            # 응답 시간 통계 조회
-            response_time_query = f'''
-                SELECT 
-                    MEAN("value") as avg_response_time,
-                    MAX("value") as max_response_time,
-                    MIN("value") as min_response_time,
-                    PERCENTILE("value", 50) as p50_response_time,
-                    PERCENTILE("value", 95) as p95_response_time,
-                    PERCENTILE("value", 99) as p99_response_time
-                FROM "http_req_duration"
-                WHERE "job_name" = '{job_name}'
-            '''
-            
-            # VU (Virtual Users) 최대값 조회
-            vus_query = f'''
-                SELECT MAX("value") as max_vus, MIN("value") as min_vus, MEAN("value") as avg_vus
-                FROM "vus"
-                WHERE "job_name" = '{job_name}'
-            '''
-
-            # 에러율 통계 조회
-            error_query = f'''
-                SELECT MIN("err") AS min_err, MAX("err") AS max_err, MEAN("err") AS avg_err
-                FROM (
-                    SELECT MEAN("value") as err
-                    FROM "http_req_failed"
-                    WHERE "job_name" = '{job_name}'
-                    GROUP BY time(5s) fill(none)
-                )
-            '''
-            
-            # 테스트 시작/종료 시간으로 duration 계산
-            start_time_query = f'''
-                SELECT * FROM "http_reqs"
-                WHERE "job_name" = '{job_name}'
-                ORDER BY time ASC LIMIT 1
-            '''
-            
-            end_time_query = f'''
-                SELECT * FROM "http_reqs"
-                WHERE "job_name" = '{job_name}'
-                ORDER BY time DESC LIMIT 1
-            '''
-            
-            # 쿼리 실행
-            total_result = list(self.client.query(total_requests_query).get_points())
-            failed_result = list(self.client.query(failed_requests_query).get_points())
-            tps_result = list(self.client.query(tps_query).get_points())
-            response_result = list(self.client.query(response_time_query).get_points())
-            error_result = list(self.client.query(error_query).get_points())
-            vus_result = list(self.client.query(vus_query).get_points())
-            start_time_result = list(self.client.query(start_time_query).get_points())
-            end_time_result = list(self.client.query(end_time_query).get_points())
-            
-            if not total_result or not total_result[0]['total_requests']:
+            # 쿼리 실행 (한 번의 요청으로 일괄 조회)
+            (
+                request_windows, failed_result, response_result,
+                error_result, vus_result, start_time_result, end_time_result
+            ) = self._query_points_batch(
+                _OVERALL_METRICS_QUERIES, bind_params={'job_name': job_name}, epoch='ns'
+            )
+            
+            # 요청 수 및 TPS 조합 (5초 단위 요청 수에서 함께 계산)
+            total_requests, max_tps, min_tps, avg_tps = _summarize_request_windows(request_windows)
+            if not total_requests:
                 logger.warning(f"No metrics found for job: {job_name}")
                 return None
             
             # 결과 조합
             # 요청 수 조합
-            total_requests = int(total_result[0]['total_requests'] or 0)
             failed_requests = int(failed_result[0]['failed_requests'] or 0) if failed_result else 0
 
             # TPS 조합
-            max_tps = int(tps_result[0]['max_tps'] or 0)
-            min_tps = int(tps_result[0]['min_tps'] or 0)
-            avg_tps = int(tps_result[0]['avg_tps'] or 0)
+            max_tps = int(max_tps)
+            min_tps = int(min_tps)
+            avg_tps = int(avg_tps)
 
             # 응답시간 조합
-            response_data = response_result[0] if response_result else {}
-            avg_response_time = float(response_data.get('avg_response_time', 0))
-            max_response_time = float(response_data.get('max_response_time', 0))
-            min_response_time = float(response_data.get('min_response_time', 0))
-            p50_response_time = float(response_data.get('p50_response_time', 0))
-            p95_response_time = float(response_data.get('p95_response_time', 0))
-            p99_response_time = float(response_data.get('p99_response_time', 0))
+            (
+                avg_response_time, max_response_time, min_response_time,
+                p50_response_time, p95_response_time, p99_response_time
+            ) = _summarize_response_times(response_result)
 
             # 에러율 조합
-            max_err = float(error_result[0]['max_err'] or 0)
-            min_err = float(error_result[0]['min_err'] or 0)
-            avg_err = float(error_result[0]['avg_err'] or 0)
+            max_err, min_err, avg_err = _summarize_error_windows(error_result)
 
             # 가상 사용자 수 조합
             max_vus = int(vus_result[0]['max_vus'] or 0) if vus_result else 0
@@ -169,17 +479,13 @@ class InfluxDBService:
             # Duration 계산 (초 단위)
             test_duration = 0.0
             if start_time_result and end_time_result:
-                from datetime import datetime
-                
-                start_time_str = start_time_result[0]['time']
-                end_time_str = end_time_result[0]['time']
-                
-                start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-                test_duration = (end_time - start_time).total_seconds()
+                # epoch='ns' 조회이므로 timestamp가 정수 나노초로 반환됨
+                start_ns = start_time_result[0]['time']
+                end_ns = end_time_result[0]['time']
+                test_duration = (end_ns - start_ns) / 1e9
                 
                 # 디버깅 로그 추가
-                logger.debug(f"Job {job_name} - Start: {start_time}, End: {end_time}, Duration: {test_duration}s")
+                logger.debug(f"Job {job_name} - Start(ns): {start_ns}, End(ns): {end_ns}, Duration: {test_duration}s")
             else:
                 logger.warning(f"Job {job_name} - Could not get start/end times")
             
@@ -193,46 +499,48 @@ class InfluxDBService:
             if actual_tps == 0.0:
                 logger.warning(f"Job {job_name} - TPS is 0! Check: total_requests={total_requests}, test_duration={test_duration}")
             
-            metrics = {
-                'total_requests': total_requests,
-                'failed_requests': failed_requests,
+            metrics = OverallMetrics(
+                total_requests=total_requests,
+                failed_requests=failed_requests,
 
-                'actual_tps': round(actual_tps, 2),  # TODO 평균 TPS 구할 때 actual vs avg
-                'max_tps': max_tps,
-                'min_tps': min_tps,
-                'avg_tps': avg_tps,
+                actual_tps=round(actual_tps, 2),  # TODO 평균 TPS 구할 때 actual vs avg
+                max_tps=max_tps,
+                min_tps=min_tps,
+                avg_tps=avg_tps,
 
-                'avg_response_time': round(avg_response_time, 2),
-                'max_response_time': round(max_response_time, 2),
-                'min_response_time': round(min_response_time, 2),
-                'p50_response_time': round(p50_response_time, 2),
-                'p95_response_time': round(p95_response_time, 2),
-                'p99_response_time': round(p99_response_time, 2),
+                avg_response_time=avg_response_time,
+                max_response_time=max_response_time,
+                min_response_time=min_response_time,
+                p50_response_time=p50_response_time,
+                p95_response_time=p95_response_time,
+                p99_response_time=p99_response_time,
 
-                'max_error_rate': round(max_err, 2),
-                'min_error_rate': round(min_err, 2),
-                'avg_error_rate': round(avg_err, 2),
+                max_error_rate=round(max_err, 2),
+                min_error_rate=round(min_err, 2),
+                avg_error_rate=round(avg_err, 2),
 
-                'max_vus': max_vus,
-                'min_vus': min_vus,
-                'avg_vus': round(avg_vus, 2),
+                max_vus=max_vus,
+                min_vus=min_vus,
+                avg_vus=round(avg_vus, 2),
 
-                'test_duration': round(test_duration, 2)
-            }
+                test_duration=round(test_duration, 2)
+            )
 
             logger.info(f"Retrieved overall metrics for job {job_name}: TPS={actual_tps:.2f}, Error Rate={error_rate:.2f}%")
+            _METRICS_CACHE.set(cache_key, metrics, completed=completed)
             return metrics
             
         except Exception as e:
             logger.error(f"Error retrieving overall metrics for job {job_name}: {e}")
             return None
     
-    def get_scenario_metrics(self, scenario_identifier: str) -> Optional[Dict]:
+    def get_scenario_metrics(self, scenario_identifier: str, completed: bool = False) -> Optional[Dict]:
         """
         특정 시나리오(엔드포인트)의 메트릭 조회
         
         Args:
             scenario_identifier: 시나리오 식별자 (예: "job-name#endpoint-id")
+            completed: 완료된 테스트 여부 (True면 결과를 만료 없이 캐싱)
             
         Returns:
             시나리오 메트릭 딕셔너리 또는 None
@@ -257,123 +565,50 @@ class InfluxDBService:
                 'test_duration': float
             }
         """
+        cache_key = ('scenario', scenario_identifier)
+        cached = _METRICS_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Scenario metrics cache hit for scenario: {scenario_identifier}")
+            return dict(cached)
+
         try:
-            # HTTP 요청 수 조회
-            total_requests_query = f'''
-                SELECT SUM("value") as total_requests
-                FROM "http_reqs"
-                WHERE "scenario" = '{scenario_identifier}'
-            '''
-            
-            # 실패한 요청 수 조회
-            failed_requests_query = f'''
-                SELECT SUM("value") as failed_requests
-                FROM "http_reqs"
-                WHERE "scenario" = '{scenario_identifier}' AND "status" !~ /^2../
-            '''
-
-            # min, max, avg tps 조회
-            tps_query = f'''
-                SELECT 
-                    MAX(tps) as max_tps,
-                    MIN(tps) as min_tps,
-                    MEAN(tps) as avg_tps
-                FROM (
-                    SELECT SUM("value")/5 as tps
-                    FROM "http_reqs"
-                    WHERE "scenario" = '{scenario_identifier}'
-                    GROUP BY time(5s) fill(none)
-                )
-            '''
-            
-            # 응답 시간 통계 조회
-            response_time_query = f'''
-                SELECT 
-                    MEAN("value") as avg_response_time,
-                    MAX("value") as max_response_time,
-                    MIN("value") as min_response_time,
-                    PERCENTILE("value", 50) as p50_response_time,
-                    PERCENTILE("value", 95) as p95_response_time,
-                    PERCENTILE("value", 99) as p99_response_time
-                FROM "http_req_duration"
-                WHERE "scenario" = '{scenario_identifier}'
-            '''
-
-            # 에러율 통계 조회
-            error_query = f'''
-                SELECT MIN("err") AS min_err, MAX("err") AS max_err, MEAN("err") AS avg_err
-                FROM (
-                    SELECT MEAN("value") as err
-                    FROM "http_req_failed"
-                    WHERE "scenario" = '{scenario_identifier}'
-                    GROUP BY time(5s) fill(none)
-                )
-            '''
-            
-            # 테스트 시간 조회 (duration 계산용)
-            start_time_query = f'''
-                SELECT * FROM "http_reqs"
-                WHERE "scenario" = '{scenario_identifier}'
-                ORDER BY time ASC LIMIT 1
-            '''
-            
-            end_time_query = f'''
-                SELECT * FROM "http_reqs"
-                WHERE "scenario" = '{scenario_identifier}'
-                ORDER BY time DESC LIMIT 1
-            '''
-            
-            # 쿼리 실행
-            total_result = list(self.client.query(total_requests_query).get_points())
-            failed_result = list(self.client.query(failed_requests_query).get_points())
-            tps_result = list(self.client.query(tps_query).get_points())
-            response_result = list(self.client.query(response_time_query).get_points())
-            error_result = list(self.client.query(error_query).get_points())
-            start_time_result = list(self.client.query(start_time_query).get_points())
-            end_time_result = list(self.client.query(end_time_query).get_points())
-            
-            if not total_result or not total_result[0]['total_requests']:
+            # 쿼리 실행 (한 번의 요청으로 일괄 조회)
+            (
+                request_windows, failed_result, response_result,
+                error_result, start_time_result, end_time_result
+            ) = self._query_points_batch(
+                _SCENARIO_METRICS_QUERIES, bind_params={'scenario': scenario_identifier}, epoch='ns'
+            )
+            
+            # 요청 수 및 TPS 조합 (5초 단위 요청 수에서 함께 계산)
+            total_requests, max_tps, min_tps, avg_tps = _summarize_request_windows(request_windows)
+            if not total_requests:
                 logger.warning(f"No metrics found for scenario: {scenario_identifier}")
                 return None
             
             # 결과 조합
             # 요청 수 조합
-            total_requests = int(total_result[0]['total_requests'] or 0)
             failed_requests = int(failed_result[0]['failed_requests'] or 0) if failed_result else 0
 
-            # TPS 조합
-            max_tps = float(tps_result[0]['max_tps'] or 0) if tps_result else 0.0
-            min_tps = float(tps_result[0]['min_tps'] or 0) if tps_result else 0.0
-            avg_tps = float(tps_result[0]['avg_tps'] or 0) if tps_result else 0.0
-
             # 응답시간 조합
-            response_data = response_result[0] if response_result else {}
-            avg_response_time = float(response_data.get('avg_response_time', 0))
-            max_response_time = float(response_data.get('max_response_time', 0))
-            min_response_time = float(response_data.get('min_response_time', 0))
-            p50_response_time = float(response_data.get('p50_response_time', 0))
-            p95_response_time = float(response_data.get('p95_response_time', 0))
-            p99_response_time = float(response_data.get('p99_response_time', 0))
+            (
+                avg_response_time, max_response_time, min_response_time,
+                p50_response_time, p95_response_time, p99_response_time
+            ) = _summarize_response_times(response_result)
 
             # 에러율 조합
-            max_err = float(error_result[0]['max_err'] or 0) if error_result else 0.0
-            min_err = float(error_result[0]['min_err'] or 0) if error_result else 0.0
-            avg_err = float(error_result[0]['avg_err'] or 0) if error_result else 0.0
+            max_err, min_err, avg_err = _summarize_error_windows(error_result)
             
             # Duration 계산 (초 단위)
             test_duration = 0.0
             if start_time_result and end_time_result:
-                from datetime import datetime
-                
-                start_time_str = start_time_result[0]['time']
-                end_time_str = end_time_result[0]['time']
-                
-                start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-                end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
-                test_duration = (end_time - start_time).total_seconds()
+                # epoch='ns' 조회이므로 timestamp가 정수 나노초로 반환됨
+                start_ns = start_time_result[0]['time']
+                end_ns = end_time_result[0]['time']
+                test_duration = (end_ns - start_ns) / 1e9
                 
                 # 디버깅 로그 추가
-                logger.debug(f"Scenario {scenario_identifier} - Start: {start_time}, End: {end_time}, Duration: {test_duration}s")
+                logger.debug(f"Scenario {scenario_identifier} - Start(ns): {start_ns}, End(ns): {end_ns}, Duration: {test_duration}s")
             else:
                 logger.warning(f"Scenario {scenario_identifier} - Could not get start/end times")
             
@@ -396,12 +631,12 @@ class InfluxDBService:
                 'min_tps': round(min_tps, 2),
                 'avg_tps': round(avg_tps, 2),
 
-                'avg_response_time': round(avg_response_time, 2),
-                'max_response_time': round(max_response_time, 2),
-                'min_response_time': round(min_response_time, 2),
-                'p50_response_time': round(p50_response_time, 2),
-                'p95_response_time': round(p95_response_time, 2),
-                'p99_response_time': round(p99_response_time, 2),
+                'avg_response_time': avg_response_time,
+                'max_response_time': max_response_time,
+                'min_response_time': min_response_time,
+                'p50_response_time': p50_response_time,
+                'p95_response_time': p95_response_time,
+                'p99_response_time': p99_response_time,
 
                 'max_error_rate': round(max_err, 2),
                 'min_error_rate': round(min_err, 2),
@@ -411,86 +646,117 @@ class InfluxDBService:
             }
             
             logger.info(f"Retrieved scenario metrics for scenario '{scenario_identifier}': TPS={actual_tps:.2f}, Error Rate={error_rate:.2f}%")
+            _METRICS_CACHE.set(cache_key, dict(metrics), completed=completed)
             return metrics
             
         except Exception as e:
             logger.error(f"Error retrieving scenario metrics for scenario '{scenario_identifier}': {e}")
             return None
 
-    def get_test_time_range(self, job_name: str) -> Optional[Tuple[datetime, datetime]]:
+    def get_scenario_metrics_bulk(
+        self,
+        scenario_identifiers: Sequence[str],
+        completed: bool = False
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        여러 시나리오의 메트릭을 동시에 조회
+
+        시나리오별 조회는 서로 독립적인 HTTP 요청이므로 스레드 풀에서 병렬로 실행하여
+        전체 지연 시간을 가장 느린 조회 하나 수준으로 줄입니다.
+
+        Args:
+            scenario_identifiers: 시나리오 식별자 리스트
+            completed: 완료된 테스트 여부 (True면 결과를 만료 없이 캐싱)
+
+        Returns:
+            {시나리오 식별자: 시나리오 메트릭 딕셔너리 또는 None}
+        """
+        identifiers = list(dict.fromkeys(scenario_identifiers))
+        results = _QUERY_EXECUTOR.map(
+            lambda identifier: self.get_scenario_metrics(identifier, completed=completed), identifiers
+        )
+        return dict(zip(identifiers, results))
+
+    def get_test_time_range(self, job_name: str, completed: bool = False) -> Optional[Tuple[datetime, datetime]]:
         """
         테스트의 시작/종료 시간을 조회
         
         Args:
             job_name: Kubernetes Job 이름
+            completed: 완료된 테스트 여부 (True면 결과를 만료 없이 캐싱)
             
         Returns:
             (start_time, end_time) 튜플 또는 None
         """
+        cache_key = ('time_range', job_name)
+        cached = _METRICS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            start_time_query = f'''
-                SELECT * FROM "http_reqs"
-                WHERE "job_name" = '{job_name}'
-                ORDER BY time ASC LIMIT 1
-            '''
-            
-            end_time_query = f'''
-                SELECT * FROM "http_reqs"
-                WHERE "job_name" = '{job_name}'
-                ORDER BY time DESC LIMIT 1
-            '''
-            
-            start_result = list(self.client.query(start_time_query).get_points())
-            end_result = list(self.client.query(end_time_query).get_points())
+            start_result, end_result = self._query_points_batch(
+                _TIME_RANGE_QUERIES, bind_params={'job_name': job_name}, epoch='ns'
+            )
             
             if not start_result or not end_result:
                 logger.warning(f"No time range found for job: {job_name}")
                 return None
                 
-            start_time_str = start_result[0]['time']
-            end_time_str = end_result[0]['time']
-            
-            start_time = datetime.fromisoformat(start_time_str.replace('Z', '+00:00'))
-            end_time = datetime.fromisoformat(end_time_str.replace('Z', '+00:00'))
+            start_time = _UTC_EPOCH + timedelta(microseconds=start_result[0]['time'] // 1000)
+            end_time = _UTC_EPOCH + timedelta(microseconds=end_result[0]['time'] // 1000)
             
             logger.info(f"Job {job_name} time range: {start_time} ~ {end_time}")
+            _METRICS_CACHE.set(cache_key, (start_time, end_time), completed=completed)
             return (start_time, end_time)
             
         except Exception as e:
             logger.error(f"Error getting time range for job {job_name}: {e}")
             return None
 
-    def get_scenario_names_for_job(self, job_name: str) -> List[str]:
+    def get_scenario_names_for_job(self, job_name: str, completed: bool = False) -> List[str]:
         """
         job_name으로 시나리오 이름들을 조회
         
         Args:
             job_name: Kubernetes Job 이름
+            completed: 완료된 테스트 여부 (True면 결과를 만료 없이 캐싱)
             
         Returns:
             시나리오 이름 리스트
         """
+        cache_key = ('scenario_names', job_name)
+        cached = _METRICS_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
-            query = f'''
-                SHOW TAG VALUES FROM "http_reqs" 
-                WITH KEY = "scenario" 
-                WHERE "job_name" = '{job_name}'
-            '''
-            result = self.client.query(query)
+            result = self.client.query(_SCENARIO_NAMES_QUERY, bind_params={'job_name': job_name})
             scenarios = [point['value'] for point in result.get_points() if 'value' in point]
             logger.info(f"Found {len(scenarios)} scenarios for job {job_name}: {scenarios}")
+            _METRICS_CACHE.set(cache_key, tuple(scenarios), completed=completed)
             return scenarios
         except Exception as e:
             logger.error(f"Error getting scenario names for job {job_name}: {e}")
             return []
 
 
-    def get_test_timeseries_data(self, job_name: str) -> Optional[List[Dict]]:
+    def invalidate_cached_metrics(self, *identifiers: str) -> None:
+        """
+        job/시나리오 식별자의 캐시된 조회 결과 제거
+
+        진행 중에 TTL로 캐싱된 결과가 완료 시점의 최종 집계에 재사용되지 않도록
+        테스트 완료 처리 전에 호출합니다.
+        """
+        for identifier in identifiers:
+            _METRICS_CACHE.invalidate(identifier)
+
+    def get_test_timeseries_data(self, job_name: str, completed: bool = False) -> Optional[List[Dict]]:
         """
         테스트 시계열 데이터 조회 (10초 단위 집계)
         
         Args:
             job_name: Kubernetes Job 이름
+            completed: 완료된 테스트 여부 (True면 시간 범위/시나리오 목록을 만료 없이 캐싱)
             
         Returns:
             시계열 데이터 리스트 또는 None
@@ -510,7 +776,7 @@ class InfluxDBService:
         """
         try:
             # 테스트 시간 범위 조회
-            time_range = self.get_test_time_range(job_name)
+            time_range = self.get_test_time_range(job_name, completed=completed)
             if not time_range:
                 logger.error(f"Could not get time range for job: {job_name}")
                 return None
@@ -520,129 +786,51 @@ class InfluxDBService:
             end_str = end_time.strftime('%Y-%m-%dT%H:%M:%SZ')
             
             # 시나리오 이름들 조회
-            scenario_names = self.get_scenario_names_for_job(job_name)
+            scenario_names = self.get_scenario_names_for_job(job_name, completed=completed)
             
             timeseries_data = []
             
-            # 전체 데이터 집계 쿼리 (TPS만)
-            overall_query = f'''
-                SELECT 
-                    SUM("value") / 5 as tps
-                FROM "http_reqs" 
-                WHERE "job_name" = '{job_name}' AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(null) TZ('Asia/Seoul')
-            '''
-            
-            # VUS 쿼리 (별도 테이블)
-            vus_query = f'''
-                SELECT 
-                    LAST("value") as vus
-                FROM "vus" 
-                WHERE "job_name" = '{job_name}' AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(null) TZ('Asia/Seoul')
-            '''
-            
-            # 에러율 쿼리 (전체) - 에러 요청과 전체 요청을 별도 조회
-            error_requests_query = f'''
-                SELECT 
-                    SUM("value") as error_requests
-                FROM "http_reqs"
-                WHERE "job_name" = '{job_name}' AND "status" !~ /^2../ AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(0) TZ('Asia/Seoul')
-            '''
-            
-            total_requests_query = f'''
-                SELECT 
-                    SUM("value") as total_requests
-                FROM "http_reqs"
-                WHERE "job_name" = '{job_name}' AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(0) TZ('Asia/Seoul')
-            '''
-            
-            # 응답시간 쿼리 (전체)
-            response_query = f'''
-                SELECT 
-                    MEAN("value") as avg_response_time,
-                    PERCENTILE("value", 95) as p95_response_time,
-                    PERCENTILE("value", 99) as p99_response_time
-                FROM "http_req_duration"
-                WHERE "job_name" = '{job_name}' AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(null) TZ('Asia/Seoul')
-            '''
-            
-            # 전체 메트릭 수집
-            overall_result = list(self.client.query(overall_query).get_points())
-            vus_result = list(self.client.query(vus_query).get_points())
-            error_requests_result = list(self.client.query(error_requests_query).get_points())
-            total_requests_result = list(self.client.query(total_requests_query).get_points())
-            response_result = list(self.client.query(response_query).get_points())
-            
-            # 결과를 타임스탬프별로 합치기
-            kst = pytz.timezone('Asia/Seoul')
-            time_metrics = {}
-            
-            for point in overall_result:
-                if point.get('tps') is not None:
-                    utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                    kst_time = utc_time.astimezone(kst)
-                    time_metrics[kst_time] = {
-                        'timestamp': kst_time,
-                        'scenario_name': None,
-                        'tps': round(float(point['tps']), 1),
-                        'vus': 0,  # VUS는 별도 처리
-                        'error_rate': 0.0,
-                        'avg_response_time': 0.0,
-                        'p95_response_time': 0.0,
-                        'p99_response_time': 0.0
-                    }
-            
-            # 에러율 데이터 합치기 - 별도 쿼리 결과 활용
-            error_requests_dict = {}
-            total_requests_dict = {}
-            
-            for point in error_requests_result:
-                utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                kst_time = utc_time.astimezone(kst)
-                error_requests_dict[kst_time] = int(point.get('error_requests', 0))
-                
-            for point in total_requests_result:
-                utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                kst_time = utc_time.astimezone(kst)
-                total_requests_dict[kst_time] = int(point.get('total_requests', 0))
-            
-            # VUS 데이터 합치기
-            for point in vus_result:
-                if point.get('vus') is not None:
-                    utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                    kst_time = utc_time.astimezone(kst)
-                    if kst_time in time_metrics:
-                        time_metrics[kst_time]['vus'] = int(point['vus'])
-
-            # 에러율 계산
-            for kst_time, metrics in time_metrics.items():
-                error_requests = error_requests_dict.get(kst_time, 0)
-                total_requests = total_requests_dict.get(kst_time, 0)
-                error_rate = (error_requests / total_requests * 100) if total_requests > 0 else 0.0
-                metrics['error_rate'] = round(error_rate, 2)
-            
-            # 응답시간 데이터 합치기
-            for point in response_result:
-                if point.get('avg_response_time') is not None:
-                    utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                    kst_time = utc_time.astimezone(kst)
-                    if kst_time in time_metrics:
-                        time_metrics[kst_time]['avg_response_time'] = round(float(point['avg_response_time']), 2)
-                        time_metrics[kst_time]['p95_response_time'] = round(float(point.get('p95_response_time', 0)), 2)
-                        time_metrics[kst_time]['p99_response_time'] = round(float(point.get('p99_response_time', 0)), 2)
-            
-            # 전체 데이터를 결과에 추가
-            timeseries_data.extend(sorted(time_metrics.values(), key=lambda x: x['timestamp']))
-            
-            # 시나리오별 데이터 수집
+            # 전체 + 시나리오별 메트릭 수집 (한 번의 요청으로 일괄 조회)
+            (
+                overall_rs, vus_rs, status_requests_rs, response_rs,
+                scenario_rs, scenario_status_requests_rs, scenario_response_rs
+            ) = self._query_results_batch(
+                _TIMESERIES_QUERIES,
+                bind_params={'job_name': job_name, 'start_time': start_str, 'end_time': end_str},
+                epoch='s'  # 정수 초 timestamp로 받아 포인트마다 ISO 문자열 파싱 생략
+            )
+            # 전체 데이터 구성 (VUS는 별도 measurement 결과에서 합치기)
+            timeseries_data.extend(_build_timeseries_entries(
+                None,
+                list(overall_rs.get_points()),
+                _TPS_WINDOW_SECONDS,
+                {point['time']: point['vus'] for point in vus_rs.get_points() if point.get('vus') is not None},
+                status_requests_rs.items(),
+                list(response_rs.get_points()),
+                KST
+            ))
+            
+            # 시나리오별 데이터 수집 - scenario 태그별 시리즈를 나눠서 구성
+            scenario_status_series = {}
+            for (name, tags), points in scenario_status_requests_rs.items():
+                scenario_status_series.setdefault((tags or {}).get('scenario'), []).append(((name, tags), points))
+
             for scenario_name in scenario_names:
-                scenario_metrics = self._get_scenario_timeseries_data(job_name, scenario_name, start_str, end_str)
-                if scenario_metrics:
-                    timeseries_data.extend(scenario_metrics)
+                scenario_tags = {'scenario': scenario_name}
+                scenario_points = list(scenario_rs.get_points(tags=scenario_tags))
+                if not scenario_points:
+                    logger.warning(f"No timeseries data found for scenario: {scenario_name}")
+                    continue
+
+                timeseries_data.extend(_build_timeseries_entries(
+                    scenario_name,
+                    scenario_points,
+                    _SCENARIO_TPS_DIVISOR,
+                    {point['time']: point['vus'] for point in scenario_points if point.get('vus')},
+                    scenario_status_series.get(scenario_name, []),
+                    list(scenario_response_rs.get_points(tags=scenario_tags)),
+                    KST
+                ))
             
             logger.info(f"Generated {len(timeseries_data)} timeseries data points for job: {job_name}")
             return timeseries_data
@@ -651,124 +839,6 @@ class InfluxDBService:
             logger.error(f"Error getting test timeseries data for job {job_name}: {e}")
             return None
 
-    def _get_scenario_timeseries_data(self, job_name: str, scenario_name: str, start_str: str, end_str: str) -> Optional[List[Dict]]:
-        """
-        시나리오별 시계열 데이터 조회 (10초 단위 집계)
-        
-        Args:
-            job_name: Kubernetes Job 이름
-            scenario_name: 시나리오 이름
-            start_str: 시작 시간 문자열
-            end_str: 종료 시간 문자열
-            
-        Returns:
-            시나리오 시계열 데이터 리스트 또는 None
-        """
-        try:
-            # 시나리오별 TPS 및 VUS 쿼리
-            scenario_query = f'''
-                SELECT 
-                    SUM("value") / 10 as tps,
-                    LAST("value") as vus
-                FROM "http_reqs" 
-                WHERE "job_name" = '{job_name}' AND "scenario" = '{scenario_name}' AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(null) TZ('Asia/Seoul')
-            '''
-            
-            # 시나리오별 에러율 쿼리 - 별도로 조회
-            scenario_error_requests_query = f'''
-                SELECT 
-                    SUM("value") as error_requests
-                FROM "http_reqs"
-                WHERE "job_name" = '{job_name}' AND "scenario" = '{scenario_name}' AND "status" !~ /^2../ AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(0) TZ('Asia/Seoul')
-            '''
-            
-            scenario_total_requests_query = f'''
-                SELECT 
-                    SUM("value") as total_requests
-                FROM "http_reqs"
-                WHERE "job_name" = '{job_name}' AND "scenario" = '{scenario_name}' AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(0) TZ('Asia/Seoul')
-            '''
-            
-            # 시나리오별 응답시간 쿼리
-            scenario_response_query = f'''
-                SELECT 
-                    MEAN("value") as avg_response_time,
-                    PERCENTILE("value", 95) as p95_response_time,
-                    PERCENTILE("value", 99) as p99_response_time
-                FROM "http_req_duration"
-                WHERE "job_name" = '{job_name}' AND "scenario" = '{scenario_name}' AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(null) TZ('Asia/Seoul')
-            '''
-            
-            # 쿼리 실행
-            scenario_result = list(self.client.query(scenario_query).get_points())
-            scenario_error_requests_result = list(self.client.query(scenario_error_requests_query).get_points())
-            scenario_total_requests_result = list(self.client.query(scenario_total_requests_query).get_points())
-            scenario_response_result = list(self.client.query(scenario_response_query).get_points())
-            
-            if not scenario_result:
-                logger.warning(f"No timeseries data found for scenario: {scenario_name}")
-                return None
-            
-            # 시나리오 결과를 타임스탬프별로 합치기
-            kst = pytz.timezone('Asia/Seoul')
-            scenario_time_metrics = {}
-            
-            for point in scenario_result:
-                if point.get('tps') is not None:
-                    utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                    kst_time = utc_time.astimezone(kst)
-                    scenario_time_metrics[kst_time] = {
-                        'timestamp': kst_time,
-                        'scenario_name': scenario_name,
-                        'tps': round(float(point['tps']), 1),
-                        'vus': int(point['vus']) if point.get('vus') else 0,
-                        'error_rate': 0.0,
-                        'avg_response_time': 0.0,
-                        'p95_response_time': 0.0,
-                        'p99_response_time': 0.0
-                    }
-            
-            # 시나리오 에러율 데이터 합치기 - 별도 쿼리 결과 활용
-            scenario_error_requests_dict = {}
-            scenario_total_requests_dict = {}
-            
-            for point in scenario_error_requests_result:
-                utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                kst_time = utc_time.astimezone(kst)
-                scenario_error_requests_dict[kst_time] = int(point.get('error_requests', 0))
-                
-            for point in scenario_total_requests_result:
-                utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                kst_time = utc_time.astimezone(kst)
-                scenario_total_requests_dict[kst_time] = int(point.get('total_requests', 0))
-            
-            # 시나리오 에러율 계산
-            for kst_time, metrics in scenario_time_metrics.items():
-                error_requests = scenario_error_requests_dict.get(kst_time, 0)
-                total_requests = scenario_total_requests_dict.get(kst_time, 0)
-                error_rate = (error_requests / total_requests * 100) if total_requests > 0 else 0.0
-                metrics['error_rate'] = round(error_rate, 2)
-            
-            # 시나리오 응답시간 데이터 합치기
-            for point in scenario_response_result:
-                if point.get('avg_response_time') is not None:
-                    utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                    kst_time = utc_time.astimezone(kst)
-                    if kst_time in scenario_time_metrics:
-                        scenario_time_metrics[kst_time]['avg_response_time'] = round(float(point['avg_response_time']), 2)
-                        scenario_time_metrics[kst_time]['p95_response_time'] = round(float(point.get('p95_response_time', 0)), 2)
-                        scenario_time_metrics[kst_time]['p99_response_time'] = round(float(point.get('p99_response_time', 0)), 2)
-            
-            return sorted(scenario_time_metrics.values(), key=lambda x: x['timestamp'])
-            
-        except Exception as e:
-            logger.error(f"Error getting scenario timeseries data for scenario {scenario_name}: {e}")
-            return None
-
     def get_cpu_metrics(self, pod_name: str, start_time: datetime, end_time: datetime) -> Optional[List[Dict]]:
         """
         특정 pod의 CPU 사용량 메트릭 조회 (5초 단위)
@@ -795,29 +865,22 @@ class InfluxDBService:
             start_str = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')
             end_str = end_time.strftime('%Y-%m-%dT%H:%M:%SZ')
             
-            # CPU 사용량 쿼리 (millicores 단위) mean vs last
-            cpu_query = f'''
-                SELECT non_negative_derivative(mean("container_cpu_usage_seconds_total"), 1s) * 1000 as cpu_millicores 
-                FROM "cadvisor_metrics" 
-                WHERE "pod" = '{pod_name}' AND "container" = '' AND "image" = '' 
-                AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(linear) TZ('Asia/Seoul')
-            '''
-            
             # 쿼리 실행
-            result = list(self.client.query(cpu_query).get_points())
+            result = list(self.client.query(
+                _CPU_METRICS_QUERY,
+                bind_params={'pod_name': pod_name, 'start_time': start_str, 'end_time': end_str},
+                epoch='s'
+            ).get_points())
             
             if not result:
                 logger.warning(f"No CPU metrics found for pod: {pod_name}")
                 return None
             
             # 결과 처리
-            kst = pytz.timezone('Asia/Seoul')
             cpu_metrics = []
             for point in result:
                 if point.get('cpu_millicores') is not None:
-                    utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                    kst_time = utc_time.astimezone(kst)
+                    kst_time = datetime.fromtimestamp(point['time'], tz=KST)
                     cpu_metrics.append({
                         'timestamp': kst_time,  # 한국시간으로 저장
                         'metric_type': 'cpu',
@@ -858,29 +921,22 @@ class InfluxDBService:
             start_str = start_time.strftime('%Y-%m-%dT%H:%M:%SZ')
             end_str = end_time.strftime('%Y-%m-%dT%H:%M:%SZ')
             
-            # Memory 사용량 쿼리 (MB 단위)
-            memory_query = f'''
-                SELECT mean("container_memory_working_set_bytes") / 1024 / 1024 as memory_mb 
-                FROM "cadvisor_metrics" 
-                WHERE "pod" = '{pod_name}' AND "container" = '' AND "image" = '' 
-                AND time >= '{start_str}' AND time < '{end_str}'
-                GROUP BY time(5s) fill(linear) TZ('Asia/Seoul')
-            '''
-            
             # 쿼리 실행
-            result = list(self.client.query(memory_query).get_points())
+            result = list(self.client.query(
+                _MEMORY_METRICS_QUERY,
+                bind_params={'pod_name': pod_name, 'start_time': start_str, 'end_time': end_str},
+                epoch='s'
+            ).get_points())
             
             if not result:
                 logger.warning(f"No Memory metrics found for pod: {pod_name}")
                 return None
             
             # 결과 처리
-            kst = pytz.timezone('Asia/Seoul')
             memory_metrics = []
             for point in result:
                 if point.get('memory_mb') is not None:
-                    utc_time = datetime.fromisoformat(point['time'].replace('Z', '+00:00'))
-                    kst_time = utc_time.astimezone(kst)
+                    kst_time = datetime.fromtimestamp(point['time'], tz=KST)
                     memory_metrics.append({
                         'timestamp': kst_time,  # 한국시간으로 저장
                         'metric_type': 'memory',
@@ -1,7 +1,9 @@
 import json
-from typing import List
+from io import StringIO
+from typing import Dict, List
 import logging
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.sqlite.models import OpenAPISpecVersionModel
@@ -11,95 +13,112 @@ from fastapi import HTTPException
 
 logger = logging.getLogger(__name__)
 
-def get_endpoint_by_id(db: Session, endpoint_id: int):
-    endpoint = db.query(EndpointModel).filter(EndpointModel.id == endpoint_id).first()
-    if not endpoint:
-        raise HTTPException(status_code=404, detail=f"Endpoint ID {endpoint_id} not found")
-    return endpoint
+# k6 스크립트 고정 구간 템플릿
+# 2xx 응답만 expected_response=true로 기록 (InfluxDB 실패 요청 집계가 이 태그를 기준으로 함)
+_K6_SCRIPT_HEADER = (
+    "import http from 'k6/http';\nimport { sleep } from 'k6';\n\n"
+    "http.setResponseCallback(http.expectedStatuses({ min: 200, max: 299 }));\n\n"
+)
+_K6_OPTIONS_HEADER_TEMPLATE = (
+    "export const options = {{\n"
+    "  tags: {{\n"
+    "    job_name: '{job_name}'\n"
+    "  }},\n"
+    "  scenarios: {{\n"
+)
+_K6_OPTIONS_FOOTER = "  }\n};\n\n"
+
+def get_endpoints_by_ids(db: Session, endpoint_ids: List[int]) -> Dict[int, EndpointModel]:
+    """여러 엔드포인트를 한 번의 IN 쿼리로 조회 (없는 ID가 있으면 404)"""
+    endpoints = db.query(EndpointModel).filter(EndpointModel.id.in_(set(endpoint_ids))).all()
+    endpoint_by_id = {endpoint.id: endpoint for endpoint in endpoints}
+
+    for endpoint_id in endpoint_ids:
+        if endpoint_id not in endpoint_by_id:
+            raise HTTPException(status_code=404, detail=f"Endpoint ID {endpoint_id} not found")
+    return endpoint_by_id
 
 def generate_k6_script(payload: LoadTestRequest, job_name: str, db: Session) -> str:
-    script_lines = []
+    buf = StringIO()
     # K6 import
-    script_lines.append("import http from 'k6/http';")
-    script_lines.append("import { sleep } from 'k6';\n")
+    buf.write(_K6_SCRIPT_HEADER)
 
     # base_url 조회 (첫 시나리오 기준으로 openapi_spec_id 역추적)
     first_scenario = payload.scenarios[0]
     logger.info("first scenario: %s", first_scenario)
 
-    endpoint = get_endpoint_by_id(db, first_scenario.endpoint_id)
-    openapi_spec = (db.query(OpenAPISpecModel)
-                    .join(OpenAPISpecModel.openapi_spec_versions)
-                    .join(OpenAPISpecVersionModel.endpoints)
-                    .filter(EndpointModel.id == endpoint.id, OpenAPISpecVersionModel.is_activate == True).first())
+    # 시나리오별 엔드포인트를 한 번에 조회
+    endpoint_by_id = get_endpoints_by_ids(db, [scenario.endpoint_id for scenario in payload.scenarios])
 
-    if not openapi_spec or not openapi_spec.base_url:
+    # OpenAPISpec 객체 대신 base_url 컬럼만 조회
+    base_url = db.execute(
+        select(OpenAPISpecModel.base_url)
+        .join(OpenAPISpecModel.openapi_spec_versions)
+        .join(OpenAPISpecVersionModel.endpoints)
+        .where(EndpointModel.id == first_scenario.endpoint_id, OpenAPISpecVersionModel.is_activate == True)
+        .limit(1)
+    ).scalar()
+
+    if not base_url:
         raise Exception("Base URL을 찾을 수 없습니다. OpenAPI 스펙에 base_url이 등록되어야 합니다.")
 
-    base_url = openapi_spec.base_url.rstrip("/")
+    base_url = base_url.rstrip("/")
 
     # K6 options
-    script_lines.append("export const options = {")
-    script_lines.append(f"  tags: {{")
-    script_lines.append(f"    job_name: '{job_name}'")
-    script_lines.append(f"  }},")
-    script_lines.append("  scenarios: {")
+    buf.write(_K6_OPTIONS_HEADER_TEMPLATE.format(job_name=job_name))
 
     for scenario in payload.scenarios:
         scenario_name = f"'{job_name}{scenario.endpoint_id}'"
-        script_lines.append(f"    {job_name}{scenario.endpoint_id}: {{")
+        buf.write(f"    {job_name}{scenario.endpoint_id}: {{\n")
         # executor 별 옵션 출력
-        option_lines = generate_k6_scenario_options(scenario, scenario_name)
-        for line in option_lines:
-            script_lines.append(line)
-        script_lines.append("    },")
-    script_lines.append("  }")
-    script_lines.append("};\n")
+        for line in generate_k6_scenario_options(scenario, scenario_name):
+            buf.write(line)
+            buf.write("\n")
+        buf.write("    },\n")
+    buf.write(_K6_OPTIONS_FOOTER)
 
     # exec 함수들
     for scenario in payload.scenarios:
-        endpoint = get_endpoint_by_id(db, scenario.endpoint_id)
+        endpoint = endpoint_by_id[scenario.endpoint_id]
         method = endpoint.method.lower()
         
         # URL 및 파라미터 처리
         url_parts = generate_url_and_params(base_url, endpoint.path, scenario)
         
-        script_lines.append(f"export function {job_name}{scenario.endpoint_id}() {{")
+        buf.write(f"export function {job_name}{scenario.endpoint_id}() {{\n")
         
         # 헤더 처리
         if scenario.headers:
-            script_lines.append("  const headers = {")
+            buf.write("  const headers = {\n")
             for header in scenario.headers:
-                script_lines.append(f"    '{header.header_key}': '{header.header_value}',")
-            script_lines.append("  };")
+                buf.write(f"    '{header.header_key}': '{header.header_value}',\n")
+            buf.write("  };\n")
         
         # HTTP 요청 생성
         if method in ['post', 'put', 'patch'] and url_parts['body']:
             # Body가 있는 요청 - JSON.stringify() 사용
-            headers_str = "headers" if scenario.headers else "{}"
             if not scenario.headers:
                 # Content-Type 헤더만 추가
-                script_lines.append(f"  const requestHeaders = {{'Content-Type': 'application/json'}};")
-                headers_str = "requestHeaders"
+                buf.write("  const requestHeaders = {'Content-Type': 'application/json'};\n")
             else:
                 # 기존 헤더에 Content-Type 추가
-                script_lines.append(f"  const requestHeaders = {{...headers, 'Content-Type': 'application/json'}};")
-                headers_str = "requestHeaders"
+                buf.write("  const requestHeaders = {...headers, 'Content-Type': 'application/json'};\n")
             
-            script_lines.append(f"  const payload = JSON.stringify({url_parts['body']});")
-            script_lines.append(f"  http.{method}('{url_parts['url']}', payload, {{ headers: {headers_str} }});")
+            buf.write(f"  const payload = JSON.stringify({url_parts['body']});\n")
+            buf.write(f"  http.{method}('{url_parts['url']}', payload, {{ headers: requestHeaders }});\n")
         else:
             # Body가 없는 요청 (GET, DELETE 등)
             # Query parameter는 이미 URL에 포함되어 있음
             if scenario.headers:
-                script_lines.append(f"  http.{method}('{url_parts['url']}', {{ headers }});")
+                buf.write(f"  http.{method}('{url_parts['url']}', {{ headers }});\n")
             else:
-                script_lines.append(f"  http.{method}('{url_parts['url']}');")
+                buf.write(f"  http.{method}('{url_parts['url']}');\n")
         
-        script_lines.append(f"  sleep({scenario.think_time});")
-        script_lines.append("}\n")
+        buf.write(f"  sleep({scenario.think_time});\n")
+        buf.write("}\n\n")
 
-    return "\n".join(script_lines)
+    # 마지막 함수 뒤의 빈 줄 하나는 제외 (기존 "\n".join 결과와 동일하게 유지)
+    return buf.getvalue()[:-1]
 
 
 def generate_k6_scenario_options(scenario: ScenarioConfig, scenario_name: str) -> List[str]:
@@ -1,6 +1,9 @@
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from kubernetes import watch
 from kubernetes.client.rest import ApiException
 from k8s.k8s_client import v1_batch, v1_core
 
@@ -18,8 +21,82 @@ class JobStatus:
 class JobService:
     """Kubernetes Job 상태 모니터링 서비스"""
 
-    def __init__(self, namespace: str = "default"):
+    def __init__(self, namespace: str = "default", status_cache_ttl: float = 2.0):
+        """
+        Args:
+            namespace: 모니터링할 네임스페이스
+            status_cache_ttl: get_job_status 결과 캐시 유지 시간(초)
+        """
         self.namespace = namespace
+        # 같은 Job을 연달아 조회하는 흐름(상태 확인 후 일시정지/중지 등)에서 API 호출을 줄이기 위한 짧은 TTL 캐시
+        self.status_cache_ttl = status_cache_ttl
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # watch 스트림으로 유지하는 Job 객체 맵 (start_watch 호출 시에만 사용)
+        self._watched_jobs: Dict[str, Any] = {}
+        self._watch: Optional[watch.Watch] = None
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop_event = threading.Event()
+
+    def start_watch(self, timeout_seconds: int = 300) -> None:
+        """
+        Job watch 스트림을 백그라운드 스레드로 시작합니다.
+
+        시작 후 get_job_status는 watch 이벤트로 갱신된 Job 객체를 우선 사용하고,
+        아직 이벤트를 받지 못한 Job만 API를 호출합니다.
+
+        Args:
+            timeout_seconds: 스트림을 다시 연결하는 주기(초)
+        """
+        if self._watch_thread and self._watch_thread.is_alive():
+            return
+
+        self._watch_stop_event.clear()
+        self._watch_thread = threading.Thread(
+            target=self._run_watch, args=(timeout_seconds,), daemon=True
+        )
+        self._watch_thread.start()
+        logger.info(f"Job watch started for namespace {self.namespace}")
+
+    def stop_watch(self) -> None:
+        """Job watch 스트림을 중지합니다."""
+        self._watch_stop_event.set()
+        if self._watch:
+            self._watch.stop()
+        if self._watch_thread and self._watch_thread.is_alive():
+            self._watch_thread.join(timeout=10)
+        self._watch_thread = None
+        self._watched_jobs.clear()
+        logger.info(f"Job watch stopped for namespace {self.namespace}")
+
+    def _run_watch(self, timeout_seconds: int) -> None:
+        """watch 스트림 메인 루프 (연결이 끊기면 전체 목록부터 다시 받음)"""
+        while not self._watch_stop_event.is_set():
+            # 재연결 시 첫 이벤트들로 전체 Job 목록이 다시 채워지므로, 끊긴 동안 삭제된 Job이 남지 않도록 비움
+            self._watched_jobs.clear()
+            self._watch = watch.Watch()
+            try:
+                for event in self._watch.stream(
+                    v1_batch.list_namespaced_job,
+                    namespace=self.namespace,
+                    timeout_seconds=timeout_seconds
+                ):
+                    job = event['object']
+                    if event['type'] == 'DELETED':
+                        self._watched_jobs.pop(job.metadata.name, None)
+                    else:
+                        self._watched_jobs[job.metadata.name] = job
+
+                    if self._watch_stop_event.is_set():
+                        break
+
+            except Exception as e:
+                logger.warning(f"Job watch stream error for namespace {self.namespace}: {e}")
+                self._watch_stop_event.wait(timeout=5)
+
+    def invalidate_job_status(self, job_name: str) -> None:
+        """Job 상태 캐시를 무효화합니다."""
+        self._status_cache.pop(job_name, None)
 
     def get_job_status(self, job_name: str) -> Dict[str, Any]:
         """
@@ -40,26 +117,22 @@ class JobService:
                 'failed_pods': int
             }
         """
+        # watch 중이면 이벤트로 갱신된 Job 객체를 API 호출 없이 사용
+        watched_job = self._watched_jobs.get(job_name)
+        if watched_job is not None:
+            return self._build_job_status_info(watched_job)
+
+        cached = self._status_cache.get(job_name)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
             job = v1_batch.read_namespaced_job(name=job_name, namespace=self.namespace)
-            status = job.status
-            
-            # Job 상태 판단
-            job_status = self._determine_job_status(status)
-            
-            result = {
-                'status': job_status,
-                'start_time': status.start_time,
-                'completion_time': status.completion_time,
-                'conditions': status.conditions or [],
-                'active_pods': status.active or 0,
-                'succeeded_pods': status.succeeded or 0,
-                'failed_pods': status.failed or 0,
-                'parallelism': job.spec.parallelism,
-                'completions': job.spec.completions
-            }
+            result = self._build_job_status_info(job)
             
-            logger.info(f"Job {job_name} status: {job_status}")
+            self._status_cache[job_name] = (time.monotonic() + self.status_cache_ttl, result)
+
+            logger.info(f"Job {job_name} status: {result['status']}")
             return result
             
         except ApiException as e:
@@ -73,6 +146,22 @@ class JobService:
             logger.error(f"Unexpected error getting job status for {job_name}: {e}")
             return {'status': JobStatus.UNKNOWN, 'error': str(e)}
 
+    def _build_job_status_info(self, job) -> Dict[str, Any]:
+        """V1Job 객체를 get_job_status 응답 딕셔너리로 변환합니다."""
+        status = job.status
+
+        return {
+            'status': self._determine_job_status(status),
+            'start_time': status.start_time,
+            'completion_time': status.completion_time,
+            'conditions': status.conditions or [],
+            'active_pods': status.active or 0,
+            'succeeded_pods': status.succeeded or 0,
+            'failed_pods': status.failed or 0,
+            'parallelism': job.spec.parallelism,
+            'completions': job.spec.completions
+        }
+
     def _determine_job_status(self, status) -> str:
         """Job 상태 객체를 기반으로 상태를 판단합니다."""
         if status.conditions:
@@ -355,6 +444,7 @@ class JobService:
         Returns:
             삭제 성공 여부
         """
+        self.invalidate_job_status(job_name)
         try:
             v1_batch.delete_namespaced_job(
                 name=job_name,
@@ -430,6 +520,7 @@ class JobService:
                 namespace=self.namespace,
                 body=body
             )
+            self.invalidate_job_status(job_name)
             
             logger.info(f"Job {job_name} suspended successfully")
             return True
@@ -468,6 +559,7 @@ class JobService:
                 namespace=self.namespace,
                 body=body
             )
+            self.invalidate_job_status(job_name)
             
             logger.info(f"Job {job_name} resumed successfully")
             return True
@@ -545,6 +637,7 @@ class JobService:
                     namespace=self.namespace,
                     propagation_policy='Background'
                 )
+                self.invalidate_job_status(job_name)
                 logger.info(f"Deleted completed job: {job_name}")
                 return True
             else:
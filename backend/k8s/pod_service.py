@@ -1,7 +1,7 @@
 from k8s.k8s_client import v1_batch, v1_core, v1_apps
 import logging
 import requests
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -81,64 +81,128 @@ class PodService:
             # Pod 정보 조회
             pod = v1_core.read_namespaced_pod(name=pod_name, namespace=self.namespace)
             
-            # Pod 기본 정보
-            pod_info = {
-                "name": pod.metadata.name,
-                "namespace": pod.metadata.namespace,
-                "labels": dict(pod.metadata.labels) if pod.metadata.labels else {},
-                "images": [container.image for container in pod.spec.containers],
-            }
+            def read_replica_set(name: str):
+                return v1_apps.read_namespaced_replica_set(name=name, namespace=self.namespace)
             
-            # ownerReferences 추적
-            resource_type = "POD"
-            group_name = None
+            return self._build_pod_details(pod, read_replica_set)
             
-            if pod.metadata.owner_references:
-                owner = pod.metadata.owner_references[0]
-                
-                if owner.kind == "ReplicaSet":
-                    # ReplicaSet에서 Deployment 찾기
-                    try:
-                        rs = v1_apps.read_namespaced_replica_set(
-                            name=owner.name, 
-                            namespace=self.namespace
-                        )
-                        
-                        if rs.metadata.owner_references:
-                            deployment_owner = rs.metadata.owner_references[0]
-                            if deployment_owner.kind == "Deployment":
-                                resource_type = "DEPLOYMENT"
-                                group_name = deployment_owner.name
-                            else:
-                                resource_type = "REPLICASET"
-                                group_name = owner.name
+        except Exception as e:
+            logger.error(f"Error getting pod details for {pod_name}: {e}")
+            return None
+
+    def list_pods(self) -> List[Any]:
+        """
+        네임스페이스의 V1Pod 목록을 한 번 조회합니다.
+        여러 bulk 조회 메서드에 같은 목록을 넘겨 Pod 목록 API 호출을 한 번으로 줄일 때 사용합니다.
+        
+        Returns:
+            V1Pod 리스트 (조회 실패 시 빈 리스트)
+        """
+        try:
+            return v1_core.list_namespaced_pod(namespace=self.namespace).items
+        except Exception as e:
+            logger.error(f"Error listing pods in namespace {self.namespace}: {e}")
+            return []
+
+    def get_pods_details_with_owner_info(self, pod_names: List[str],
+                                         pods: Optional[List[Any]] = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        여러 Pod의 상세 정보와 owner 정보를 한 번에 조회합니다.
+        Pod/ReplicaSet 목록을 각각 한 번만 조회한 뒤 이름으로 매칭합니다.
+        
+        Args:
+            pod_names: Pod 이름 리스트
+            pods: 이미 조회한 V1Pod 리스트 (없으면 직접 조회)
+            
+        Returns:
+            Pod 이름별 상세 정보 (get_pod_details_with_owner_info와 동일한 형식, 없으면 None)
+        """
+        try:
+            if pods is None:
+                pods = v1_core.list_namespaced_pod(namespace=self.namespace).items
+            replica_set_list = v1_apps.list_namespaced_replica_set(namespace=self.namespace)
+        except Exception as e:
+            logger.error(f"Error listing pods for details in namespace {self.namespace}: {e}")
+            return {pod_name: None for pod_name in pod_names}
+        
+        pods_by_name = {pod.metadata.name: pod for pod in pods}
+        replica_sets_by_name = {rs.metadata.name: rs for rs in replica_set_list.items}
+        
+        results = {}
+        for pod_name in pod_names:
+            pod = pods_by_name.get(pod_name)
+            if pod is None:
+                logger.warning(f"Pod {pod_name} not found in namespace {self.namespace}")
+                results[pod_name] = None
+                continue
+            
+            try:
+                results[pod_name] = self._build_pod_details(pod, replica_sets_by_name.__getitem__)
+            except Exception as e:
+                logger.error(f"Error getting pod details for {pod_name}: {e}")
+                results[pod_name] = None
+        
+        return results
+
+    def _build_pod_details(self, pod, read_replica_set: Callable[[str], Any]) -> Dict[str, Any]:
+        """
+        V1Pod 객체에서 상세 정보를 만들고 ownerReferences를 추적합니다.
+        
+        Args:
+            pod: V1Pod 객체
+            read_replica_set: ReplicaSet 이름으로 V1ReplicaSet을 반환하는 함수 (실패 시 예외)
+        """
+        # Pod 기본 정보
+        pod_info = {
+            "name": pod.metadata.name,
+            "namespace": pod.metadata.namespace,
+            "labels": dict(pod.metadata.labels) if pod.metadata.labels else {},
+            "images": [container.image for container in pod.spec.containers],
+        }
+        
+        # ownerReferences 추적
+        resource_type = "POD"
+        group_name = None
+        
+        if pod.metadata.owner_references:
+            owner = pod.metadata.owner_references[0]
+            
+            if owner.kind == "ReplicaSet":
+                # ReplicaSet에서 Deployment 찾기
+                try:
+                    rs = read_replica_set(owner.name)
+                    
+                    if rs.metadata.owner_references:
+                        deployment_owner = rs.metadata.owner_references[0]
+                        if deployment_owner.kind == "Deployment":
+                            resource_type = "DEPLOYMENT"
+                            group_name = deployment_owner.name
                         else:
                             resource_type = "REPLICASET"
                             group_name = owner.name
-                            
-                    except Exception as e:
-                        logger.warning(f"Failed to read ReplicaSet {owner.name}: {e}")
+                    else:
                         resource_type = "REPLICASET"
                         group_name = owner.name
                         
-                elif owner.kind == "Deployment":
-                    resource_type = "DEPLOYMENT"
+                except Exception as e:
+                    logger.warning(f"Failed to read ReplicaSet {owner.name}: {e}")
+                    resource_type = "REPLICASET"
                     group_name = owner.name
-                else:
-                    resource_type = owner.kind.upper()
-                    group_name = owner.name
-            
-            pod_info.update({
-                "resource_type": resource_type,
-                "group_name": group_name,
-                "service_type": self._determine_service_type(pod_info["images"])
-            })
-            
-            return pod_info
-            
-        except Exception as e:
-            logger.error(f"Error getting pod details for {pod_name}: {e}")
-            return None
+                    
+            elif owner.kind == "Deployment":
+                resource_type = "DEPLOYMENT"
+                group_name = owner.name
+            else:
+                resource_type = owner.kind.upper()
+                group_name = owner.name
+        
+        pod_info.update({
+            "resource_type": resource_type,
+            "group_name": group_name,
+            "service_type": self._determine_service_type(pod_info["images"])
+        })
+        
+        return pod_info
     
     def _determine_service_type(self, images: List[str]) -> str:
         """
@@ -300,42 +364,66 @@ class PodService:
                 ...
             ]
         """
-        services = []
-        
         try:
             # 네임스페이스의 모든 서비스 조회
             service_list = v1_core.list_namespaced_service(namespace=self.namespace)
-            
-            for service in service_list.items:
-                # Service의 selector와 Pod의 label이 매치되는지 확인
-                if service.spec.selector and self._labels_match(service.spec.selector, pod_labels):
-                    # 일반 포트와 NodePort 정보를 모두 포함
-                    ports = []
-                    node_ports = []
-                    port_mappings = {}  # NodePort -> Service Port 매핑
-                    if service.spec.ports:
-                        for port in service.spec.ports:
-                            ports.append(port.port)
-                            if port.node_port:  # NodePort가 있는 경우
-                                node_ports.append(port.node_port)
-                                port_mappings[port.node_port] = port.port  # NodePort -> Service Port 매핑
-                    
-                    service_info = {
-                        "name": service.metadata.name,
-                        "ports": ports,
-                        "node_ports": node_ports,
-                        "port_mappings": port_mappings,  # NodePort -> Service Port 매핑 추가
-                        "cluster_ip": service.spec.cluster_ip,
-                        "type": service.spec.type
-                    }
-                    services.append(service_info)
-                    
-            return services
+            return self._match_services(service_list.items, pod_labels)
             
         except Exception as e:
             logger.error(f"Error finding services for pod labels {pod_labels}: {e}")
             return []
 
+    def find_services_for_pods(self, pod_labels_by_name: Dict[str, Dict[str, str]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 Pod에 연결된 Service를 한 번의 Service 목록 조회로 찾습니다.
+        
+        Args:
+            pod_labels_by_name: Pod 이름별 라벨 딕셔너리
+            
+        Returns:
+            Pod 이름별 연결된 Service 정보 리스트 (find_services_for_pod와 동일한 형식)
+        """
+        try:
+            service_list = v1_core.list_namespaced_service(namespace=self.namespace)
+        except Exception as e:
+            logger.error(f"Error listing services in namespace {self.namespace}: {e}")
+            return {pod_name: [] for pod_name in pod_labels_by_name}
+        
+        return {
+            pod_name: self._match_services(service_list.items, pod_labels)
+            for pod_name, pod_labels in pod_labels_by_name.items()
+        }
+
+    def _match_services(self, services, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
+        """V1Service 목록 중 selector가 Pod 라벨과 매치되는 Service 정보를 반환합니다."""
+        matched = []
+        
+        for service in services:
+            # Service의 selector와 Pod의 label이 매치되는지 확인
+            if service.spec.selector and self._labels_match(service.spec.selector, pod_labels):
+                # 일반 포트와 NodePort 정보를 모두 포함
+                ports = []
+                node_ports = []
+                port_mappings = {}  # NodePort -> Service Port 매핑
+                if service.spec.ports:
+                    for port in service.spec.ports:
+                        ports.append(port.port)
+                        if port.node_port:  # NodePort가 있는 경우
+                            node_ports.append(port.node_port)
+                            port_mappings[port.node_port] = port.port  # NodePort -> Service Port 매핑
+                
+                service_info = {
+                    "name": service.metadata.name,
+                    "ports": ports,
+                    "node_ports": node_ports,
+                    "port_mappings": port_mappings,  # NodePort -> Service Port 매핑 추가
+                    "cluster_ip": service.spec.cluster_ip,
+                    "type": service.spec.type
+                }
+                matched.append(service_info)
+                
+        return matched
+
     def find_workloads_for_pod(self, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
         """
         Pod labels와 매치되는 모든 워크로드(Deployment, StatefulSet, DaemonSet, ReplicaSet)를 조회합니다.
@@ -381,118 +469,165 @@ class PodService:
 
         return workloads
 
+    def find_workloads_for_pods(self, pod_labels_by_name: Dict[str, Dict[str, str]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        여러 Pod에 매치되는 워크로드를 워크로드 타입별 한 번의 목록 조회로 찾습니다.
+
+        Args:
+            pod_labels_by_name: Pod 이름별 라벨 딕셔너리
+
+        Returns:
+            Pod 이름별 워크로드 정보 리스트 (find_workloads_for_pod와 동일한 형식/순서)
+        """
+        workloads_by_pod = {pod_name: [] for pod_name in pod_labels_by_name}
+
+        for kind, list_workloads, match_workloads in (
+            ("deployments", v1_apps.list_namespaced_deployment, self._match_deployments),
+            ("statefulsets", v1_apps.list_namespaced_stateful_set, self._match_statefulsets),
+            ("daemonsets", v1_apps.list_namespaced_daemon_set, self._match_daemonsets),
+            ("replicasets", v1_apps.list_namespaced_replica_set, self._match_replicasets),
+        ):
+            items = self._list_workload_items(list_workloads, kind)
+            for pod_name, pod_labels in pod_labels_by_name.items():
+                try:
+                    workloads_by_pod[pod_name].extend(match_workloads(items, pod_labels))
+                except Exception as e:
+                    logger.error(f"Error finding {kind} for pod labels {pod_labels}: {e}")
+
+        return workloads_by_pod
+
+    def _list_workload_items(self, list_workloads: Callable[..., Any], kind: str) -> List[Any]:
+        """네임스페이스의 워크로드 목록 조회 (실패 시 빈 리스트)"""
+        try:
+            return list_workloads(namespace=self.namespace).items
+        except Exception as e:
+            logger.error(f"Error listing {kind} in namespace {self.namespace}: {e}")
+            return []
+
     def _find_deployments(self, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
         """Deployment 조회"""
-        deployments = []
-
         try:
             deployment_list = v1_apps.list_namespaced_deployment(namespace=self.namespace)
-
-            for deployment in deployment_list.items:
-                if deployment.spec.selector and self._labels_match(deployment.spec.selector.match_labels, pod_labels):
-                    deployment_info = {
-                        "type": "Deployment",
-                        "name": deployment.metadata.name,
-                        "namespace": deployment.metadata.namespace,
-                        "desired_replicas": deployment.spec.replicas or 0,
-                        "current_replicas": deployment.status.replicas or 0,
-                        "ready_replicas": deployment.status.ready_replicas or 0,
-                        "updated_replicas": deployment.status.updated_replicas or 0,
-                        "labels": deployment.metadata.labels or {},
-                        "creation_timestamp": deployment.metadata.creation_timestamp
-                    }
-                    deployments.append(deployment_info)
-
-            return deployments
+            return self._match_deployments(deployment_list.items, pod_labels)
 
         except Exception as e:
             logger.error(f"Error finding deployments for pod labels {pod_labels}: {e}")
             return []
 
+    def _match_deployments(self, items, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
+        """V1Deployment 목록 중 selector가 Pod 라벨과 매치되는 Deployment 정보를 반환합니다."""
+        deployments = []
+
+        for deployment in items:
+            if deployment.spec.selector and self._labels_match(deployment.spec.selector.match_labels, pod_labels):
+                deployment_info = {
+                    "type": "Deployment",
+                    "name": deployment.metadata.name,
+                    "namespace": deployment.metadata.namespace,
+                    "desired_replicas": deployment.spec.replicas or 0,
+                    "current_replicas": deployment.status.replicas or 0,
+                    "ready_replicas": deployment.status.ready_replicas or 0,
+                    "updated_replicas": deployment.status.updated_replicas or 0,
+                    "labels": deployment.metadata.labels or {},
+                    "creation_timestamp": deployment.metadata.creation_timestamp
+                }
+                deployments.append(deployment_info)
+
+        return deployments
+
     def _find_statefulsets(self, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
         """StatefulSet 조회"""
-        statefulsets = []
-
         try:
             statefulset_list = v1_apps.list_namespaced_stateful_set(namespace=self.namespace)
-
-            for statefulset in statefulset_list.items:
-                if statefulset.spec.selector and self._labels_match(statefulset.spec.selector.match_labels, pod_labels):
-                    statefulset_info = {
-                        "type": "StatefulSet",
-                        "name": statefulset.metadata.name,
-                        "namespace": statefulset.metadata.namespace,
-                        "desired_replicas": statefulset.spec.replicas or 0,
-                        "current_replicas": statefulset.status.replicas or 0,
-                        "ready_replicas": statefulset.status.ready_replicas or 0,
-                        "updated_replicas": statefulset.status.updated_replicas or 0,
-                        "labels": statefulset.metadata.labels or {},
-                        "creation_timestamp": statefulset.metadata.creation_timestamp
-                    }
-                    statefulsets.append(statefulset_info)
-
-            return statefulsets
+            return self._match_statefulsets(statefulset_list.items, pod_labels)
 
         except Exception as e:
             logger.error(f"Error finding statefulsets for pod labels {pod_labels}: {e}")
             return []
 
+    def _match_statefulsets(self, items, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
+        """V1StatefulSet 목록 중 selector가 Pod 라벨과 매치되는 StatefulSet 정보를 반환합니다."""
+        statefulsets = []
+
+        for statefulset in items:
+            if statefulset.spec.selector and self._labels_match(statefulset.spec.selector.match_labels, pod_labels):
+                statefulset_info = {
+                    "type": "StatefulSet",
+                    "name": statefulset.metadata.name,
+                    "namespace": statefulset.metadata.namespace,
+                    "desired_replicas": statefulset.spec.replicas or 0,
+                    "current_replicas": statefulset.status.replicas or 0,
+                    "ready_replicas": statefulset.status.ready_replicas or 0,
+                    "updated_replicas": statefulset.status.updated_replicas or 0,
+                    "labels": statefulset.metadata.labels or {},
+                    "creation_timestamp": statefulset.metadata.creation_timestamp
+                }
+                statefulsets.append(statefulset_info)
+
+        return statefulsets
+
     def _find_daemonsets(self, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
         """DaemonSet 조회"""
-        daemonsets = []
-
         try:
             daemonset_list = v1_apps.list_namespaced_daemon_set(namespace=self.namespace)
-
-            for daemonset in daemonset_list.items:
-                if daemonset.spec.selector and self._labels_match(daemonset.spec.selector.match_labels, pod_labels):
-                    daemonset_info = {
-                        "type": "DaemonSet",
-                        "name": daemonset.metadata.name,
-                        "namespace": daemonset.metadata.namespace,
-                        "desired_replicas": daemonset.status.desired_number_scheduled or 0,
-                        "current_replicas": daemonset.status.current_number_scheduled or 0,
-                        "ready_replicas": daemonset.status.number_ready or 0,
-                        "updated_replicas": daemonset.status.updated_number_scheduled or 0,
-                        "labels": daemonset.metadata.labels or {},
-                        "creation_timestamp": daemonset.metadata.creation_timestamp
-                    }
-                    daemonsets.append(daemonset_info)
-
-            return daemonsets
+            return self._match_daemonsets(daemonset_list.items, pod_labels)
 
         except Exception as e:
             logger.error(f"Error finding daemonsets for pod labels {pod_labels}: {e}")
             return []
 
+    def _match_daemonsets(self, items, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
+        """V1DaemonSet 목록 중 selector가 Pod 라벨과 매치되는 DaemonSet 정보를 반환합니다."""
+        daemonsets = []
+
+        for daemonset in items:
+            if daemonset.spec.selector and self._labels_match(daemonset.spec.selector.match_labels, pod_labels):
+                daemonset_info = {
+                    "type": "DaemonSet",
+                    "name": daemonset.metadata.name,
+                    "namespace": daemonset.metadata.namespace,
+                    "desired_replicas": daemonset.status.desired_number_scheduled or 0,
+                    "current_replicas": daemonset.status.current_number_scheduled or 0,
+                    "ready_replicas": daemonset.status.number_ready or 0,
+                    "updated_replicas": daemonset.status.updated_number_scheduled or 0,
+                    "labels": daemonset.metadata.labels or {},
+                    "creation_timestamp": daemonset.metadata.creation_timestamp
+                }
+                daemonsets.append(daemonset_info)
+
+        return daemonsets
+
     def _find_replicasets(self, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
         """ReplicaSet 조회"""
-        replicasets = []
-
         try:
             replicaset_list = v1_apps.list_namespaced_replica_set(namespace=self.namespace)
-
-            for replicaset in replicaset_list.items:
-                if replicaset.spec.selector and self._labels_match(replicaset.spec.selector.match_labels, pod_labels):
-                    replicaset_info = {
-                        "type": "ReplicaSet",
-                        "name": replicaset.metadata.name,
-                        "namespace": replicaset.metadata.namespace,
-                        "desired_replicas": replicaset.spec.replicas or 0,
-                        "current_replicas": replicaset.status.replicas or 0,
-                        "ready_replicas": replicaset.status.ready_replicas or 0,
-                        "updated_replicas": replicaset.status.replicas or 0,  # ReplicaSet은 updated_replicas가 없어서 replicas 사용
-                        "labels": replicaset.metadata.labels or {},
-                        "creation_timestamp": replicaset.metadata.creation_timestamp
-                    }
-                    replicasets.append(replicaset_info)
-
-            return replicasets
+            return self._match_replicasets(replicaset_list.items, pod_labels)
 
         except Exception as e:
             logger.error(f"Error finding replicasets for pod labels {pod_labels}: {e}")
             return []
 
+    def _match_replicasets(self, items, pod_labels: Dict[str, str]) -> List[Dict[str, Any]]:
+        """V1ReplicaSet 목록 중 selector가 Pod 라벨과 매치되는 ReplicaSet 정보를 반환합니다."""
+        replicasets = []
+
+        for replicaset in items:
+            if replicaset.spec.selector and self._labels_match(replicaset.spec.selector.match_labels, pod_labels):
+                replicaset_info = {
+                    "type": "ReplicaSet",
+                    "name": replicaset.metadata.name,
+                    "namespace": replicaset.metadata.namespace,
+                    "desired_replicas": replicaset.spec.replicas or 0,
+                    "current_replicas": replicaset.status.replicas or 0,
+                    "ready_replicas": replicaset.status.ready_replicas or 0,
+                    "updated_replicas": replicaset.status.replicas or 0,  # ReplicaSet은 updated_replicas가 없어서 replicas 사용
+                    "labels": replicaset.metadata.labels or {},
+                    "creation_timestamp": replicaset.metadata.creation_timestamp
+                }
+                replicasets.append(replicaset_info)
+
+        return replicasets
+
     def _labels_match(self, selector: Dict[str, str], pod_labels: Dict[str, str]) -> bool:
         """
         Service selector와 Pod labels가 매치되는지 확인합니다.
@@ -37,53 +37,73 @@ class ResourceService:
         """
         try:
             pod = v1_core.read_namespaced_pod(name=pod_name, namespace=self.namespace)
+            result = self._build_pod_resource_specs(pod)
             
-            containers_resources = []
-            
-            for container in pod.spec.containers:
-                container_resource = {
-                    "name": container.name,
-                    "cpu_request_millicores": 0.0,
-                    "cpu_limit_millicores": 0.0,
-                    "memory_request_mb": 0.0,
-                    "memory_limit_mb": 0.0
-                }
-                
-                # Resource requests 파싱
-                if container.resources and container.resources.requests:
-                    requests = container.resources.requests
-                    
-                    if "cpu" in requests:
-                        container_resource["cpu_request_millicores"] = self._parse_cpu_to_millicores(requests["cpu"])
-                    
-                    if "memory" in requests:
-                        container_resource["memory_request_mb"] = self._parse_memory_to_mb(requests["memory"])
-                
-                # Resource limits 파싱
-                if container.resources and container.resources.limits:
-                    limits = container.resources.limits
-                    
-                    if "cpu" in limits:
-                        container_resource["cpu_limit_millicores"] = self._parse_cpu_to_millicores(limits["cpu"])
-                    
-                    if "memory" in limits:
-                        container_resource["memory_limit_mb"] = self._parse_memory_to_mb(limits["memory"])
-                
-                containers_resources.append(container_resource)
-            
-            result = {
-                "pod_name": pod_name,
-                "namespace": self.namespace,
-                "containers": containers_resources
-            }
-            
-            logger.info(f"Retrieved resource specs for pod {pod_name}: {len(containers_resources)} containers")
+            logger.info(f"Retrieved resource specs for pod {pod_name}: {len(result['containers'])} containers")
             return result
             
         except Exception as e:
             logger.error(f"Error getting pod resource specs for {pod_name}: {e}")
             return None
 
+    def _build_pod_resource_specs(self, pod) -> Dict[str, Any]:
+        """V1Pod 객체에서 컨테이너별 resource spec을 추출합니다."""
+        containers_resources = []
+        
+        for container in pod.spec.containers:
+            container_resource = {
+                "name": container.name,
+                "cpu_request_millicores": 0.0,
+                "cpu_limit_millicores": 0.0,
+                "memory_request_mb": 0.0,
+                "memory_limit_mb": 0.0
+            }
+            
+            # Resource requests 파싱
+            if container.resources and container.resources.requests:
+                requests = container.resources.requests
+                
+                if "cpu" in requests:
+                    container_resource["cpu_request_millicores"] = self._parse_cpu_to_millicores(requests["cpu"])
+                
+                if "memory" in requests:
+                    container_resource["memory_request_mb"] = self._parse_memory_to_mb(requests["memory"])
+            
+            # Resource limits 파싱
+            if container.resources and container.resources.limits:
+                limits = container.resources.limits
+                
+                if "cpu" in limits:
+                    container_resource["cpu_limit_millicores"] = self._parse_cpu_to_millicores(limits["cpu"])
+                
+                if "memory" in limits:
+                    container_resource["memory_limit_mb"] = self._parse_memory_to_mb(limits["memory"])
+            
+            containers_resources.append(container_resource)
+        
+        return {
+            "pod_name": pod.metadata.name,
+            "namespace": self.namespace,
+            "containers": containers_resources
+        }
+
+    def _aggregate_container_resources(self, containers: List[Dict[str, Any]]) -> Dict[str, float]:
+        """컨테이너별 resource spec을 Pod 단위로 합산합니다."""
+        aggregated = {
+            "cpu_request_millicores": 0.0,
+            "cpu_limit_millicores": 0.0,
+            "memory_request_mb": 0.0,
+            "memory_limit_mb": 0.0
+        }
+        
+        for container in containers:
+            aggregated["cpu_request_millicores"] += container["cpu_request_millicores"]
+            aggregated["cpu_limit_millicores"] += container["cpu_limit_millicores"]
+            aggregated["memory_request_mb"] += container["memory_request_mb"]
+            aggregated["memory_limit_mb"] += container["memory_limit_mb"]
+        
+        return aggregated
+
     def get_pod_aggregated_resources(self, pod_name: str) -> Optional[Dict[str, float]]:
         """
         Pod의 모든 컨테이너 리소스를 합계하여 반환합니다.
@@ -106,18 +126,7 @@ class ResourceService:
             if not pod_specs:
                 return None
             
-            aggregated = {
-                "cpu_request_millicores": 0.0,
-                "cpu_limit_millicores": 0.0,
-                "memory_request_mb": 0.0,
-                "memory_limit_mb": 0.0
-            }
-            
-            for container in pod_specs["containers"]:
-                aggregated["cpu_request_millicores"] += container["cpu_request_millicores"]
-                aggregated["cpu_limit_millicores"] += container["cpu_limit_millicores"]
-                aggregated["memory_request_mb"] += container["memory_request_mb"]
-                aggregated["memory_limit_mb"] += container["memory_limit_mb"]
+            aggregated = self._aggregate_container_resources(pod_specs["containers"])
             
             logger.info(f"Aggregated resource specs for pod {pod_name}: "
                        f"CPU req={aggregated['cpu_request_millicores']}m, "
@@ -131,12 +140,15 @@ class ResourceService:
             logger.error(f"Error aggregating pod resource specs for {pod_name}: {e}")
             return None
 
-    def get_multiple_pods_resources(self, pod_names: List[str]) -> Dict[str, Optional[Dict[str, float]]]:
+    def get_multiple_pods_resources(self, pod_names: List[str],
+                                    pods: Optional[List[Any]] = None) -> Dict[str, Optional[Dict[str, float]]]:
         """
         여러 Pod의 집계된 리소스를 한 번에 조회합니다.
+        Pod마다 API를 호출하지 않고 네임스페이스의 Pod 목록을 한 번만 조회하여 매칭합니다.
         
         Args:
             pod_names: Pod 이름 리스트
+            pods: 이미 조회한 V1Pod 리스트 (없으면 직접 조회)
             
         Returns:
             Pod별 집계된 리소스 정보
@@ -151,10 +163,25 @@ class ResourceService:
                 ...
             }
         """
+        if pods is None:
+            try:
+                pods = v1_core.list_namespaced_pod(namespace=self.namespace).items
+            except Exception as e:
+                logger.error(f"Error listing pods for resource specs in namespace {self.namespace}: {e}")
+                return {pod_name: None for pod_name in pod_names}
+        
+        pods_by_name = {pod.metadata.name: pod for pod in pods}
         results = {}
         
         for pod_name in pod_names:
-            results[pod_name] = self.get_pod_aggregated_resources(pod_name)
+            pod = pods_by_name.get(pod_name)
+            if pod is None:
+                logger.warning(f"Pod {pod_name} not found in namespace {self.namespace}")
+                results[pod_name] = None
+                continue
+            
+            pod_specs = self._build_pod_resource_specs(pod)
+            results[pod_name] = self._aggregate_container_resources(pod_specs["containers"])
         
         logger.info(f"Retrieved resource specs for {len(pod_names)} pods")
         return results